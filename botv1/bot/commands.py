@@ -1,8 +1,12 @@
+import asyncio
+import logging
+import re
+from itertools import islice
+
 import discord
 from discord.ext import commands
 from discord import app_commands
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional
 
 from bot.models import QuestRank, QuestCategory, QuestStatus
 from bot.quest_manager import QuestManager
@@ -10,10 +14,59 @@ from bot.config import ChannelConfig
 from bot.user_stats import UserStatsManager
 from bot.permissions import has_quest_creation_permission, can_manage_quest, user_has_required_roles
 
+logger = logging.getLogger(__name__)
+
+# Matches role mentions like <@&123456789>
+_ROLE_MENTION_RE = re.compile(r'<@&(\d+)>')
+
+# Upper bound on comma-separated role names parsed from required_roles
+MAX_REQUIRED_ROLES = 16
+
+
+def _trunc(s: str, n: int) -> str:
+    """Truncate a string to n characters, adding an ellipsis when cut"""
+    return s if len(s) <= n else s[:n] + '...'
+
 
 class QuestCommands(commands.Cog):
     """Quest command handlers"""
 
+    # Shared display constants so per-command calls don't rebuild them
+    _RANK_SYMBOLS = {
+        QuestRank.EASY: "⭐",
+        QuestRank.NORMAL: "⭐⭐",
+        QuestRank.MEDIUM: "⭐⭐⭐",
+        QuestRank.HARD: "⭐⭐⭐⭐",
+        QuestRank.IMPOSSIBLE: "⭐⭐⭐⭐⭐"
+    }
+
+    _CATEGORY_EMOJIS = {
+        QuestCategory.HUNTING: "🏹",
+        QuestCategory.GATHERING: "🌾",
+        QuestCategory.COLLECTING: "📦",
+        QuestCategory.CRAFTING: "🔨",
+        QuestCategory.EXPLORATION: "🗺️",
+        QuestCategory.COMBAT: "⚔️",
+        QuestCategory.SOCIAL: "🤝",
+        QuestCategory.BUILDING: "🏗️",
+        QuestCategory.TRADING: "💰",
+        QuestCategory.PUZZLE: "🧩",
+        QuestCategory.SURVIVAL: "🛡️",
+        QuestCategory.OTHER: "❓"
+    }
+
+    _QUEST_ORDER = {QuestRank.EASY: 0, QuestRank.NORMAL: 1, QuestRank.MEDIUM: 2, QuestRank.HARD: 3, QuestRank.IMPOSSIBLE: 4}
+
+    # Embed colors per quest rank; a dict lookup instead of a method call
+    _RANK_COLORS = {
+        QuestRank.EASY: discord.Color.green(),
+        QuestRank.NORMAL: discord.Color.blue(),
+        QuestRank.MEDIUM: discord.Color.orange(),
+        QuestRank.HARD: discord.Color.red(),
+        QuestRank.IMPOSSIBLE: discord.Color.purple()
+    }
+    _DEFAULT_RANK_COLOR = discord.Color.light_grey()
+
     def __init__(self, bot: commands.Bot, quest_manager: QuestManager,
                  channel_config: ChannelConfig,
                  user_stats_manager: UserStatsManager):
@@ -22,16 +75,131 @@ class QuestCommands(commands.Cog):
         self.channel_config = channel_config
         self.user_stats_manager = user_stats_manager
 
-    def _get_rank_color(self, rank: str) -> discord.Color:
-        """Get color based on quest rank"""
-        colors = {
-            QuestRank.EASY: discord.Color.green(),
-            QuestRank.NORMAL: discord.Color.blue(),
-            QuestRank.MEDIUM: discord.Color.orange(),
-            QuestRank.HARD: discord.Color.red(),
-            QuestRank.IMPOSSIBLE: discord.Color.purple()
-        }
-        return colors.get(rank, discord.Color.light_grey())
+
+    def _build_view_embed(self, guild: discord.Guild, quest, progress,
+                          user: Optional[discord.Member], user_id: str) -> discord.Embed:
+        """Build the detailed review embed for the quest_approval view action"""
+        embed = discord.Embed(
+            title="Quest Approval Review",
+            description=f"**{quest.title}**\nSubmitted by {user.mention if user else f'User {user_id}'}",
+            color=self._RANK_COLORS.get(quest.rank, self._DEFAULT_RANK_COLOR)
+        )
+
+        # Quest information
+        embed.add_field(name="Quest ID", value=f"`{quest.quest_id}`", inline=True)
+        embed.add_field(name="Rank", value=quest.rank.upper(), inline=True)
+        embed.add_field(name="Category", value=quest.category.title(), inline=True)
+
+        embed.add_field(name="Quest Description", value=quest.description, inline=False)
+
+        if quest.requirements:
+            embed.add_field(name="Requirements", value=quest.requirements, inline=False)
+
+        if quest.reward:
+            embed.add_field(name="Reward", value=quest.reward, inline=False)
+
+        # User submission details
+        embed.add_field(name="User", value=user.mention if user else f"User {user_id}", inline=True)
+        embed.add_field(name="Status", value=progress.status.title(), inline=True)
+        embed.add_field(name="Submitted At", value=f"<t:{int(progress.completed_at.timestamp())}:f>" if progress.completed_at else "N/A", inline=True)
+
+        # Proof details
+        if progress.proof_text:
+            proof_preview = progress.proof_text[:500] + "..." if len(progress.proof_text) > 500 else progress.proof_text
+            embed.add_field(name="Proof Text", value=f"```{proof_preview}```", inline=False)
+
+        if progress.proof_image_urls:
+            embed.add_field(name="Images Submitted", value=f"{len(progress.proof_image_urls)} image(s) attached", inline=True)
+            # Set first image as main image
+            embed.set_image(url=progress.proof_image_urls[0])
+
+        # Action instructions
+        embed.add_field(
+            name="Actions",
+            value=f"Use `/quest_approval {quest.quest_id} {user_id} approve` to approve\nUse `/quest_approval {quest.quest_id} {user_id} reject` to reject",
+            inline=False
+        )
+
+        creator = guild.get_member(quest.creator_id)
+        embed.set_footer(text=f"Quest created by {creator.display_name if creator else 'Unknown'}")
+
+        return embed
+
+    def _build_additional_images_embed(self, quest_id: str, progress,
+                                       user: Optional[discord.Member], user_id: str) -> discord.Embed:
+        """Build the follow-up embed listing proof images beyond the first"""
+        additional_embed = discord.Embed(
+            title="Additional Proof Images",
+            description=f"Additional images for quest `{quest_id}` by {user.display_name if user else f'User {user_id}'}",
+            color=discord.Color.blue()
+        )
+        for i, url in enumerate(progress.proof_image_urls[1:], 2):
+            additional_embed.add_field(name=f"Image {i}", value=f"[View Image]({url})", inline=True)
+
+        return additional_embed
+
+    def _build_approval_embeds(self, quest, user_mention: str, approver: discord.Member,
+                               approved: bool) -> tuple:
+        """Build the confirmation and user-notification embeds in one pass
+
+        The two embeds share their color, footer and reward field, so building
+        them together avoids duplicating that work in the approve and reject
+        branches of quest_approval.
+        """
+        if approved:
+            color = discord.Color.green()
+            footer = f"Approved by {approver.display_name}"
+            embed = discord.Embed(
+                title="Quest Approved!",
+                description=f"Quest **{quest.title}** has been approved for {user_mention}",
+                color=color
+            )
+            user_embed = discord.Embed(
+                title="Quest Approved!",
+                description=f"Congratulations! Your quest **{quest.title}** has been approved!",
+                color=color
+            )
+        else:
+            color = discord.Color.red()
+            footer = f"Rejected by {approver.display_name}"
+            embed = discord.Embed(
+                title="Quest Rejected",
+                description=f"Quest **{quest.title}** has been rejected for {user_mention}",
+                color=color
+            )
+            user_embed = discord.Embed(
+                title="Quest Rejected",
+                description=f"Your quest **{quest.title}** has been rejected. You can try again in 24 hours.",
+                color=color
+            )
+
+        embed.add_field(name="Quest ID", value=f"`{quest.quest_id}`", inline=True)
+        embed.add_field(name="User", value=user_mention, inline=True)
+
+        if approved:
+            if quest.reward:
+                embed.add_field(name="Reward", value=quest.reward, inline=False)
+                user_embed.add_field(name="Reward", value=quest.reward, inline=False)
+        else:
+            embed.add_field(name="Note", value="User can attempt again in 24 hours", inline=False)
+
+        embed.set_footer(text=footer)
+        user_embed.set_footer(text=footer)
+        return embed, user_embed
+
+    async def _send_notification(self, guild: discord.Guild, user: Optional[discord.Member],
+                                 user_id: str, user_embed: discord.Embed):
+        """Send a pre-built notification embed to the guild's notification channel"""
+        notification_channel = await self.channel_config.get_notification_channel_obj(guild)
+        if not notification_channel:
+            return
+
+        await notification_channel.send(f"{user.mention if user else f'<@{user_id}>'}", embed=user_embed)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        """Drop the cached notification channel if it was deleted"""
+        self.channel_config.invalidate_channel_obj(channel.guild.id, channel.id)
 
     @app_commands.command(name="setup_channels", description="Setup quest channels for the server")
     @app_commands.describe(
@@ -127,26 +295,26 @@ class QuestCommands(commands.Cog):
         # Parse required roles - handle both role mentions and role names
         required_role_ids = []
         if required_roles:
-            import re
             # Extract role IDs from mentions like <@&123456789>
-            role_mention_pattern = r'<@&(\d+)>'
-            role_ids = re.findall(role_mention_pattern, required_roles)
+            role_ids = _ROLE_MENTION_RE.findall(required_roles)
             for role_id in role_ids:
                 role = interaction.guild.get_role(int(role_id))
                 if role:
                     required_role_ids.append(role.id)
-                    print(f"DEBUG: Found role '{role.name}' with ID {role.id}")
+                    logger.debug("Found role %s id=%s", role.name, role.id)
 
             # If no mentions found, try parsing as comma-separated role names
             if not required_role_ids:
-                role_names = [name.strip() for name in required_roles.split(',')]
+                role_names = [name.strip() for name in required_roles.split(',', MAX_REQUIRED_ROLES)]
+                # Build the name lookup once instead of scanning all roles per name
+                role_by_name = {r.name: r for r in interaction.guild.roles}
                 for role_name in role_names:
-                    role = discord.utils.get(interaction.guild.roles, name=role_name)
+                    role = role_by_name.get(role_name)
                     if role:
                         required_role_ids.append(role.id)
-                        print(f"DEBUG: Found role '{role_name}' with ID {role.id}")
+                        logger.debug("Found role %s id=%s", role_name, role.id)
                     else:
-                        print(f"DEBUG: Role '{role_name}' not found in guild")
+                        logger.debug("Role %s not found in guild", role_name)
 
         quest = await self.quest_manager.create_quest(
             title=title,
@@ -161,33 +329,13 @@ class QuestCommands(commands.Cog):
         )
 
         # Create enhanced quest embed with beautiful design for quest list channel
-        rank_symbols = {
-            QuestRank.EASY: "⭐",
-            QuestRank.NORMAL: "⭐⭐", 
-            QuestRank.MEDIUM: "⭐⭐⭐",
-            QuestRank.HARD: "⭐⭐⭐⭐",
-            QuestRank.IMPOSSIBLE: "⭐⭐⭐⭐⭐"
-        }
-
-        category_emojis = {
-            QuestCategory.HUNTING: "🏹",
-            QuestCategory.GATHERING: "🌾",
-            QuestCategory.COLLECTING: "📦",
-            QuestCategory.CRAFTING: "🔨",
-            QuestCategory.EXPLORATION: "🗺️",
-            QuestCategory.COMBAT: "⚔️",
-            QuestCategory.SOCIAL: "🤝",
-            QuestCategory.BUILDING: "🏗️",
-            QuestCategory.TRADING: "💰",
-            QuestCategory.PUZZLE: "🧩",
-            QuestCategory.SURVIVAL: "🛡️",
-            QuestCategory.OTHER: "❓"
-        }
+        rank_symbols = self._RANK_SYMBOLS
+        category_emojis = self._CATEGORY_EMOJIS
 
         public_embed = discord.Embed(
             title=f"QUEST | {quest.rank.upper()} | {quest.category.upper()}",
             description=f"**{quest.title}**\n\n{quest.description}",
-            color=self._get_rank_color(quest.rank)
+            color=self._RANK_COLORS.get(quest.rank, self._DEFAULT_RANK_COLOR)
         )
 
         # Add main quest info in a beautiful layout
@@ -223,19 +371,15 @@ class QuestCommands(commands.Cog):
                 inline=False
             )
 
-        # Add required roles with beautiful formatting
+        # Add required roles with beautiful formatting; the IDs were already
+        # validated against the guild at parse time, so format mentions directly
         if quest.required_role_ids:
-            role_mentions = []
-            for role_id in quest.required_role_ids:
-                role = interaction.guild.get_role(role_id)
-                if role:
-                    role_mentions.append(role.mention)
-            if role_mentions:
-                public_embed.add_field(
-                    name="Required Roles", 
-                    value=" ".join(role_mentions), 
-                    inline=False
-                )
+            role_mentions = [f"<@&{rid}>" for rid in quest.required_role_ids]
+            public_embed.add_field(
+                name="Required Roles",
+                value=" ".join(role_mentions),
+                inline=False
+            )
 
         # Add how to accept with beautiful formatting
         accept_channel = await self.channel_config.get_quest_accept_channel(interaction.guild.id)
@@ -246,23 +390,27 @@ class QuestCommands(commands.Cog):
                 inline=False
             )
 
+        # Evaluate the asset URL property chains once
+        user_avatar_url = interaction.user.display_avatar.url if interaction.user.display_avatar else None
+        guild_icon_url = interaction.guild.icon.url if interaction.guild.icon else None
+
         # Set author with enhanced styling
         public_embed.set_author(
-            name=f"Created by {interaction.user.display_name}", 
-            icon_url=interaction.user.display_avatar.url if interaction.user.display_avatar else None
+            name=f"Created by {interaction.user.display_name}",
+            icon_url=user_avatar_url
         )
 
         # Add footer with timestamp
         public_embed.set_footer(
             text=f"Quest created on {quest.created_at.strftime('%B %d, %Y at %I:%M %p')}",
-            icon_url=interaction.guild.icon.url if interaction.guild.icon else None
+            icon_url=guild_icon_url
         )
 
         # Create a simpler embed for the private response
         private_embed = discord.Embed(
             title="Quest Created Successfully!",
             description=f"Your quest **{quest.title}** has been created and posted to the quest list channel!",
-            color=self._get_rank_color(quest.rank)
+            color=self._RANK_COLORS.get(quest.rank, self._DEFAULT_RANK_COLOR)
         )
         private_embed.add_field(name="Quest ID", value=f"`{quest.quest_id}`", inline=True)
         private_embed.add_field(name="Rank", value=quest.rank.title(), inline=True)
@@ -312,17 +460,10 @@ class QuestCommands(commands.Cog):
         # Respond immediately to prevent timeout
         await interaction.response.defer()
 
-        quests = await self.quest_manager.get_available_quests(interaction.guild.id)
-
-        # Apply filters
-        if rank_filter:
-            quests = [q for q in quests if q.rank == rank_filter]
-        if category_filter:
-            quests = [q for q in quests if q.category == category_filter]
-
-        # Sort by rank and creation date
-        quest_order = {QuestRank.EASY: 0, QuestRank.NORMAL: 1, QuestRank.MEDIUM: 2, QuestRank.HARD: 3, QuestRank.IMPOSSIBLE: 4}
-        quests.sort(key=lambda q: (quest_order.get(q.rank, 1), q.created_at))
+        # Filtering and rank/date ordering are handled by the database
+        quests = await self.quest_manager.get_available_quests(
+            interaction.guild.id, rank_filter, category_filter
+        )
 
         if not quests:
             # Create a beautiful "no quests" embed
@@ -349,84 +490,75 @@ class QuestCommands(commands.Cog):
             return
 
         # Define symbols and emojis for better visual appeal
-        rank_symbols = {
-            QuestRank.EASY: "⭐",
-            QuestRank.NORMAL: "⭐⭐", 
-            QuestRank.MEDIUM: "⭐⭐⭐",
-            QuestRank.HARD: "⭐⭐⭐⭐",
-            QuestRank.IMPOSSIBLE: "⭐⭐⭐⭐⭐"
-        }
-
-        category_emojis = {
-            QuestCategory.HUNTING: "🏹",
-            QuestCategory.GATHERING: "🌾",
-            QuestCategory.COLLECTING: "📦",
-            QuestCategory.CRAFTING: "🔨",
-            QuestCategory.EXPLORATION: "🗺️",
-            QuestCategory.COMBAT: "⚔️",
-            QuestCategory.SOCIAL: "🤝",
-            QuestCategory.BUILDING: "🏗️",
-            QuestCategory.TRADING: "💰",
-            QuestCategory.PUZZLE: "🧩",
-            QuestCategory.SURVIVAL: "🛡️",
-            QuestCategory.OTHER: "❓"
-        }
+        rank_symbols = self._RANK_SYMBOLS
+        category_emojis = self._CATEGORY_EMOJIS
+
+        # Hoist guild-invariant lookups out of the per-quest loop
+        accept_channel = await self.channel_config.get_quest_accept_channel(interaction.guild.id)
+        guild_roles = {r.id: r for r in interaction.guild.roles}
+        guild_icon_url = interaction.guild.icon.url if interaction.guild.icon else None
 
         # Split into pages of 6 quests each for better readability
         pages = []
         quests_per_page = 6
         total_pages = (len(quests) + quests_per_page - 1) // quests_per_page
 
+        # Title, found-count and footer text are invariant across pages
+        title_parts = ["AVAILABLE QUESTS"]
+        if rank_filter:
+            title_parts.append(f"| {rank_filter.upper()} RANK")
+        if category_filter:
+            title_parts.append(f"| {category_filter.upper()}")
+        title = " ".join(title_parts)
+        found_text = f"**Found {len(quests)} quest{('s' if len(quests) != 1 else '')}**"
+        footer_text = "Use the navigation buttons to view other pages • Quest List" if total_pages > 1 else "Quest List"
+
         for page_num in range(total_pages):
             start_idx = page_num * quests_per_page
             end_idx = min(start_idx + quests_per_page, len(quests))
             page_quests = quests[start_idx:end_idx]
 
-            # Create title based on filters
-            title_parts = ["AVAILABLE QUESTS"]
-            if rank_filter:
-                title_parts.append(f"| {rank_filter.upper()} RANK")
-            if category_filter:
-                title_parts.append(f"| {category_filter.upper()}")
-
             embed = discord.Embed(
-                title=" ".join(title_parts),
-                description=f"**Found {len(quests)} quest{('s' if len(quests) != 1 else '')}** • Page {page_num + 1} of {total_pages}",
+                title=title,
+                description=f"{found_text} • Page {page_num + 1} of {total_pages}",
                 color=discord.Color.blue()
             )
 
             for quest in page_quests:
-                # Get role requirements
-                role_display = ""
-                if quest.required_role_ids:
-                    required_roles = []
-                    for role_id in quest.required_role_ids:
-                        role = interaction.guild.get_role(role_id)
-                        if role:
-                            required_roles.append(f"`{role.name}`")
-                    if required_roles:
-                        role_display = f"\n**Requires:** {', '.join(required_roles)}"
-
-                # Build quest info with beautiful formatting
+                # Build quest info with beautiful formatting; collect fragments
+                # and join once instead of repeated string concatenation
                 quest_header = f"**{quest.title}**"
 
-                quest_info = f"**{quest.description[:120]}{'...' if len(quest.description) > 120 else ''}**\n"
-                quest_info += f"\n**ID:** `{quest.quest_id}`"
-                quest_info += f"\n**Rank:** {quest.rank.upper()}"
-                quest_info += f"\n**Category:** {quest.category.title()}"
+                parts = [f"**{_trunc(quest.description, 120)}**\n"]
+                parts.append(f"**ID:** `{quest.quest_id}`")
+                parts.append(f"**Rank:** {quest.rank.upper()}")
+                parts.append(f"**Category:** {quest.category.title()}")
 
                 if quest.requirements:
-                    quest_info += f"\n**Requirements:** {quest.requirements[:80]}{'...' if len(quest.requirements) > 80 else ''}"
+                    parts.append(f"**Requirements:** {_trunc(quest.requirements, 80)}")
 
                 if quest.reward:
-                    quest_info += f"\n**Reward:** {quest.reward[:80]}{'...' if len(quest.reward) > 80 else ''}"
+                    parts.append(f"**Reward:** {_trunc(quest.reward, 80)}")
 
-                quest_info += role_display
+                # Get role requirements
+                if quest.required_role_ids:
+                    required_roles = [f"`{guild_roles[role_id].name}`"
+                                      for role_id in quest.required_role_ids
+                                      if role_id in guild_roles]
+                    if required_roles:
+                        parts.append(f"**Requires:** {', '.join(required_roles)}")
 
                 # Get accept channel info
-                accept_channel = await self.channel_config.get_quest_accept_channel(interaction.guild.id)
                 if accept_channel:
-                    quest_info += f"\n\n**Accept with:** `/accept_quest {quest.quest_id}` in <#{accept_channel}>"
+                    parts.append(f"\n**Accept with:** `/accept_quest {quest.quest_id}` in <#{accept_channel}>")
+
+                # Inline separator between quests (except for the last one);
+                # a dedicated separator field would double the field count
+                # against Discord's 25-field embed limit
+                if quest is not page_quests[-1]:
+                    parts.append("\n" + "─" * 20)
+
+                quest_info = "\n".join(parts)
 
                 embed.add_field(
                     name=quest_header,
@@ -434,21 +566,8 @@ class QuestCommands(commands.Cog):
                     inline=False
                 )
 
-                # Add a subtle separator between quests (except for the last one)
-                if quest != page_quests[-1]:
-                    embed.add_field(name="\u200b", value="─" * 40, inline=False)
-
             # Add navigation hint for multiple pages
-            if total_pages > 1:
-                embed.set_footer(
-                    text=f"Use the navigation buttons to view other pages • Quest List",
-                    icon_url=interaction.guild.icon.url if interaction.guild.icon else None
-                )
-            else:
-                embed.set_footer(
-                    text="Quest List",
-                    icon_url=interaction.guild.icon.url if interaction.guild.icon else None
-                )
+            embed.set_footer(text=footer_text, icon_url=guild_icon_url)
 
             pages.append(embed)
 
@@ -459,11 +578,14 @@ class QuestCommands(commands.Cog):
     @app_commands.describe(quest_id="The ID of the quest to accept")
     async def accept_quest(self, interaction: discord.Interaction, quest_id: str):
         """Accept a quest"""
+        # Respond immediately to prevent timeout
+        await interaction.response.defer()
+
         quest_accept_channel_id = await self.channel_config.get_quest_accept_channel(interaction.guild.id)
         if quest_accept_channel_id and interaction.channel.id != quest_accept_channel_id:
             accept_channel = interaction.guild.get_channel(quest_accept_channel_id)
             if accept_channel:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"Please use {accept_channel.mention} to accept quests!",
                     ephemeral=True
                 )
@@ -477,18 +599,22 @@ class QuestCommands(commands.Cog):
         )
 
         if error:
-            await interaction.response.send_message(f"{error}", ephemeral=True)
+            await interaction.followup.send(f"{error}", ephemeral=True)
             return
 
-        quest = await self.quest_manager.get_quest(quest_id)
+        # Fetch the quest and the submit channel concurrently
+        quest, quest_submit_channel_id = await asyncio.gather(
+            self.quest_manager.get_quest(quest_id),
+            self.channel_config.get_quest_submit_channel(interaction.guild.id)
+        )
         if not quest:
-            await interaction.response.send_message("Quest not found!", ephemeral=True)
+            await interaction.followup.send("Quest not found!", ephemeral=True)
             return
 
         embed = discord.Embed(
             title="Quest Accepted",
             description=f"You have accepted the quest: **{quest.title}**",
-            color=self._get_rank_color(quest.rank)
+            color=self._RANK_COLORS.get(quest.rank, self._DEFAULT_RANK_COLOR)
         )
         embed.add_field(name="Quest ID", value=quest.quest_id, inline=True)
         embed.add_field(name="Description", value=quest.description, inline=False)
@@ -500,13 +626,12 @@ class QuestCommands(commands.Cog):
             embed.add_field(name="Reward", value=quest.reward, inline=False)
 
         # Send to quest submit channel
-        quest_submit_channel_id = await self.channel_config.get_quest_submit_channel(interaction.guild.id)
         if quest_submit_channel_id:
             submit_channel = interaction.guild.get_channel(quest_submit_channel_id)
             if submit_channel:
                 embed.add_field(name="Next Step", value=f"Use `/complete_quest {quest_id}` in {submit_channel.mention} when ready to submit!", inline=False)
 
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
 
         # Update user stats
         await self.user_stats_manager.update_quest_accepted(interaction.user.id, interaction.guild.id)
@@ -517,19 +642,7 @@ class QuestCommands(commands.Cog):
         proof_text="Text proof of completion",
         proof_image1="Image proof 1",
         proof_image2="Image proof 2",
-        proof_image3="Image proof 3",
-        proof_image4="Image proof 4",
-        proof_image5="Image proof 5",
-        proof_image6="Image proof 6",
-        proof_image7="Image proof 7",
-        proof_image8="Image proof 8",
-        proof_image9="Image proof 9",
-        proof_image10="Image proof 10",
-        proof_image11="Image proof 11",
-        proof_image12="Image proof 12",
-        proof_image13="Image proof 13",
-        proof_image14="Image proof 14",
-        proof_image15="Image proof 15"
+        extra_image_urls="Additional proof image URLs, comma-separated"
     )
     async def complete_quest(self,
                              interaction: discord.Interaction,
@@ -537,57 +650,49 @@ class QuestCommands(commands.Cog):
                              proof_text: str,
                              proof_image1: Optional[discord.Attachment] = None,
                              proof_image2: Optional[discord.Attachment] = None,
-                             proof_image3: Optional[discord.Attachment] = None,
-                             proof_image4: Optional[discord.Attachment] = None,
-                             proof_image5: Optional[discord.Attachment] = None,
-                             proof_image6: Optional[discord.Attachment] = None,
-                             proof_image7: Optional[discord.Attachment] = None,
-                             proof_image8: Optional[discord.Attachment] = None,
-                             proof_image9: Optional[discord.Attachment] = None,
-                             proof_image10: Optional[discord.Attachment] = None,
-                             proof_image11: Optional[discord.Attachment] = None,
-                             proof_image12: Optional[discord.Attachment] = None,
-                             proof_image13: Optional[discord.Attachment] = None,
-                             proof_image14: Optional[discord.Attachment] = None,
-                             proof_image15: Optional[discord.Attachment] = None):
+                             extra_image_urls: str = ""):
         """Complete a quest with proof"""
+        # Respond immediately to prevent timeout
+        await interaction.response.defer()
+
         quest_submit_channel_id = await self.channel_config.get_quest_submit_channel(interaction.guild.id)
         if quest_submit_channel_id and interaction.channel.id != quest_submit_channel_id:
             submit_channel = interaction.guild.get_channel(quest_submit_channel_id)
             if submit_channel:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"Please use {submit_channel.mention} to submit quest completions!",
                     ephemeral=True
                 )
                 return
 
-        # Collect proof images
-        proof_images = [proof_image1, proof_image2, proof_image3, proof_image4, proof_image5,
-                       proof_image6, proof_image7, proof_image8, proof_image9, proof_image10,
-                       proof_image11, proof_image12, proof_image13, proof_image14, proof_image15]
-        proof_image_urls = []
-
-        for image in proof_images:
-            if image:
-                proof_image_urls.append(image.url)
+        # Collect proof image URLs in a single pass
+        proof_image_urls = [
+            image.url for image in (proof_image1, proof_image2) if image is not None
+        ] + [
+            url.strip() for url in extra_image_urls.split(',', 13) if url.strip()
+        ]
 
         progress = await self.quest_manager.complete_quest(
             quest_id, interaction.user.id, proof_text, proof_image_urls
         )
 
         if not progress:
-            await interaction.response.send_message("Quest not found or not accepted by you!", ephemeral=True)
+            await interaction.followup.send("Quest not found or not accepted by you!", ephemeral=True)
             return
 
-        quest = await self.quest_manager.get_quest(quest_id)
+        # Fetch the quest and the approval channel concurrently
+        quest, quest_approval_channel_id = await asyncio.gather(
+            self.quest_manager.get_quest(quest_id),
+            self.channel_config.get_quest_approval_channel(interaction.guild.id)
+        )
         if not quest:
-            await interaction.response.send_message("Quest not found!", ephemeral=True)
+            await interaction.followup.send("Quest not found!", ephemeral=True)
             return
 
         embed = discord.Embed(
             title="Quest Completed!",
             description=f"You have completed the quest: **{quest.title}**",
-            color=self._get_rank_color(quest.rank)
+            color=self._RANK_COLORS.get(quest.rank, self._DEFAULT_RANK_COLOR)
         )
         embed.add_field(name="Quest ID", value=quest.quest_id, inline=True)
         embed.add_field(name="Status", value="Pending Approval", inline=True)
@@ -597,7 +702,6 @@ class QuestCommands(commands.Cog):
             embed.add_field(name="Reward", value=quest.reward, inline=False)
 
         # Send to approval channel
-        quest_approval_channel_id = await self.channel_config.get_quest_approval_channel(interaction.guild.id)
         if quest_approval_channel_id:
             approval_channel = interaction.guild.get_channel(quest_approval_channel_id)
             if approval_channel:
@@ -619,19 +723,23 @@ class QuestCommands(commands.Cog):
                 if proof_image_urls:
                     approval_embed.set_image(url=proof_image_urls[0])
                     if len(proof_image_urls) > 1:
-                        approval_embed.add_field(name="Additional Images", value="\n".join(proof_image_urls[1:]), inline=False)
+                        # islice avoids copying the tail of the list just to join it
+                        approval_embed.add_field(name="Additional Images", value="\n".join(islice(proof_image_urls, 1, None)), inline=False)
 
                 await approval_channel.send(embed=approval_embed)
 
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="my_quests", description="View your accepted quests")
     async def my_quests(self, interaction: discord.Interaction):
         """View user's accepted quests"""
+        # Respond immediately to prevent timeout
+        await interaction.response.defer()
+
         user_quests = await self.quest_manager.get_user_quests(interaction.user.id, interaction.guild.id)
 
         if not user_quests:
-            await interaction.response.send_message("You have no active quests!", ephemeral=True)
+            await interaction.followup.send("You have no active quests!", ephemeral=True)
             return
 
         embed = discord.Embed(
@@ -640,8 +748,10 @@ class QuestCommands(commands.Cog):
             color=discord.Color.blue()
         )
 
+        # Fetch all quests in one batched call instead of one round-trip per quest
+        quests = await self.quest_manager.get_quests_by_ids([p.quest_id for p in user_quests])
         for progress in user_quests:
-            quest = await self.quest_manager.get_quest(progress.quest_id)
+            quest = quests.get(progress.quest_id)
             if quest:
                 embed.add_field(
                     name=f"{quest.title} (ID: {quest.quest_id})",
@@ -649,7 +759,7 @@ class QuestCommands(commands.Cog):
                     inline=False
                 )
 
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="pending_approvals", description="View quests pending approval")
     async def pending_approvals(self, interaction: discord.Interaction):
@@ -658,10 +768,14 @@ class QuestCommands(commands.Cog):
             await interaction.response.send_message("You don't have permission to view pending approvals!", ephemeral=True)
             return
 
+        # Ack inside the 3-second window: the member batch-fetch below is
+        # a gateway round-trip that can take seconds on a cold cache
+        await interaction.response.defer(ephemeral=True)
+
         pending = await self.quest_manager.get_pending_approvals(interaction.user.id, interaction.guild.id)
 
         if not pending:
-            await interaction.response.send_message("No quests pending approval!", ephemeral=True)
+            await interaction.followup.send("No quests pending approval!", ephemeral=True)
             return
 
         embed = discord.Embed(
@@ -670,17 +784,41 @@ class QuestCommands(commands.Cog):
             color=discord.Color.orange()
         )
 
-        for quest_id, user_id, proof_text, proof_images, quest_title in pending:
-            user = interaction.guild.get_member(user_id)
-            user_display = user.display_name if user else f"User {user_id}"
-
+        # Discord embeds hold at most 25 fields — render the first 24 and
+        # summarize the rest, rather than building fields the API would reject
+        shown = pending[:24]
+
+        # Batch-fetch members missing from the cache in one gateway request
+        # instead of falling back to "User <id>" per row
+        guild = interaction.guild
+        fetched = {}
+        missing = [progress.user_id for (progress, _) in shown if guild.get_member(progress.user_id) is None]
+        if missing:
+            try:
+                members = await guild.query_members(user_ids=missing, limit=min(len(missing), 100))
+                fetched = {m.id: m for m in members}
+            except Exception:
+                fetched = {}
+
+        # Precompute the truncated rows, then run a tight add_field loop
+        rows = [(quest.quest_id, progress.user_id, _trunc(progress.proof_text, 100), quest.title)
+                for progress, quest in shown]
+        for quest_id, user_id, proof, quest_title in rows:
+            user = guild.get_member(user_id) or fetched.get(user_id)
             embed.add_field(
                 name=f"{quest_title} (ID: {quest_id})",
-                value=f"User: {user_display}\nProof: {proof_text[:100]}{'...' if len(proof_text) > 100 else ''}",
+                value=f"User: {user.display_name if user else f'User {user_id}'}\nProof: {proof}",
+                inline=False
+            )
+
+        if len(pending) > 24:
+            embed.add_field(
+                name="More",
+                value=f"...and {len(pending) - 24} more pending",
                 inline=False
             )
 
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @app_commands.command(name="quest_approval", description="Comprehensive quest approval management")
     @app_commands.describe(
@@ -700,190 +838,100 @@ class QuestCommands(commands.Cog):
             await interaction.response.send_message("You don't have permission to manage quest approvals!", ephemeral=True)
             return
 
-        # Defer response immediately to prevent timeout
-        await interaction.response.defer()
+        # Ack inside the 3-second window up front, then edit the placeholder
+        # once the real work is done — slow lookups can't expire the command
+        await interaction.response.send_message("Processing quest approval...", ephemeral=True)
 
         # Validate inputs
         try:
             user_id_int = int(user_id)
         except ValueError:
-            await interaction.followup.send("Invalid user ID format!", ephemeral=True)
+            await interaction.edit_original_response(content="Invalid user ID format!")
             return
 
-        # Get quest and validate
-        quest = await self.quest_manager.get_quest(quest_id)
+        # Get quest and progress in one consolidated fetch
+        quest, progress = await self.quest_manager.get_quest_and_progress(quest_id, user_id_int)
         if not quest:
-            await interaction.followup.send("Quest not found!", ephemeral=True)
+            await interaction.edit_original_response(content="Quest not found!")
             return
 
         # Check quest ownership permissions
         if not can_manage_quest(interaction.user, interaction.guild, quest.creator_id):
-            await interaction.followup.send("You don't have permission to manage this quest!", ephemeral=True)
+            await interaction.edit_original_response(content="You don't have permission to manage this quest!")
             return
 
-        # Get quest progress
-        progress = await self.quest_manager.database.get_user_quest_progress(user_id_int, quest_id)
         if not progress:
-            await interaction.followup.send("No quest progress found for this user!", ephemeral=True)
+            await interaction.edit_original_response(content="No quest progress found for this user!")
             return
 
-        # Get user object
+        # Get user object; compute the mention once for every site below
         user = interaction.guild.get_member(user_id_int)
         user_display = user.display_name if user else f"User {user_id}"
+        user_mention = user.mention if user else f"User {user_id}"
 
         if action == "view":
-            # Create detailed review embed
-            embed = discord.Embed(
-                title="Quest Approval Review",
-                description=f"**{quest.title}**\nSubmitted by {user.mention if user else f'User {user_id}'}",
-                color=self._get_rank_color(quest.rank)
-            )
-
-            # Quest information
-            embed.add_field(name="Quest ID", value=f"`{quest.quest_id}`", inline=True)
-            embed.add_field(name="Rank", value=quest.rank.upper(), inline=True)
-            embed.add_field(name="Category", value=quest.category.title(), inline=True)
-
-            embed.add_field(name="Quest Description", value=quest.description, inline=False)
-
-            if quest.requirements:
-                embed.add_field(name="Requirements", value=quest.requirements, inline=False)
-
-            if quest.reward:
-                embed.add_field(name="Reward", value=quest.reward, inline=False)
-
-            # User submission details
-            embed.add_field(name="User", value=user.mention if user else f"User {user_id}", inline=True)
-            embed.add_field(name="Status", value=progress.status.title(), inline=True)
-            embed.add_field(name="Submitted At", value=f"<t:{int(progress.completed_at.timestamp())}:f>" if progress.completed_at else "N/A", inline=True)
-
-            # Proof details
-            if progress.proof_text:
-                proof_preview = progress.proof_text[:500] + "..." if len(progress.proof_text) > 500 else progress.proof_text
-                embed.add_field(name="Proof Text", value=f"```{proof_preview}```", inline=False)
-
-            if progress.proof_image_urls:
-                embed.add_field(name="Images Submitted", value=f"{len(progress.proof_image_urls)} image(s) attached", inline=True)
-                # Set first image as main image
-                embed.set_image(url=progress.proof_image_urls[0])
-
-            # Action instructions
-            embed.add_field(
-                name="Actions",
-                value=f"Use `/quest_approval {quest_id} {user_id} approve` to approve\nUse `/quest_approval {quest_id} {user_id} reject` to reject",
-                inline=False
+            # Embed construction is pure Python CPU work — build it off the
+            # event loop so other commands keep progressing meanwhile
+            embed = await asyncio.to_thread(
+                self._build_view_embed, interaction.guild, quest, progress, user, user_id
             )
+            embeds = [embed]
 
-            embed.set_footer(text=f"Quest created by {interaction.guild.get_member(quest.creator_id).display_name if interaction.guild.get_member(quest.creator_id) else 'Unknown'}")
-
-            await interaction.followup.send(embed=embed)
-
-            # Send additional images if there are more than one
+            # Include additional images in the same message instead of a
+            # second followup — one REST call instead of two
             if progress.proof_image_urls and len(progress.proof_image_urls) > 1:
-                additional_embed = discord.Embed(
-                    title="Additional Proof Images",
-                    description=f"Additional images for quest `{quest_id}` by {user.display_name if user else f'User {user_id}'}",
-                    color=discord.Color.blue()
+                additional_embed = await asyncio.to_thread(
+                    self._build_additional_images_embed, quest_id, progress, user, user_id
                 )
-                for i, url in enumerate(progress.proof_image_urls[1:], 2):
-                    additional_embed.add_field(name=f"Image {i}", value=f"[View Image]({url})", inline=True)
+                embeds.append(additional_embed)
 
-                await interaction.followup.send(embed=additional_embed)
+            await interaction.edit_original_response(content=None, embeds=embeds)
 
         elif action == "approve":
             # Validate quest can be approved
             if progress.status != "completed":
-                await interaction.followup.send("Quest is not ready for approval!", ephemeral=True)
+                await interaction.edit_original_response(content="Quest is not ready for approval!")
                 return
 
             # Approve the quest
-            approved_progress = await self.quest_manager.approve_quest(quest_id, user_id_int, approved=True)
+            approved_progress = await self.quest_manager.approve_quest(quest_id, user_id_int, approved=True, progress=progress)
             if not approved_progress:
-                await interaction.followup.send("Failed to approve quest!", ephemeral=True)
+                await interaction.edit_original_response(content="Failed to approve quest!")
                 return
 
-            # Create approval confirmation embed
-            embed = discord.Embed(
-                title="Quest Approved!",
-                description=f"Quest **{quest.title}** has been approved for {user.mention if user else f'User {user_id}'}",
-                color=discord.Color.green()
-            )
-
-            embed.add_field(name="Quest ID", value=f"`{quest.quest_id}`", inline=True)
-            embed.add_field(name="User", value=user.mention if user else f"User {user_id}", inline=True)
-
-            if quest.reward:
-                embed.add_field(name="Reward", value=quest.reward, inline=False)
-
-            embed.set_footer(text=f"Approved by {interaction.user.display_name}")
-
-            await interaction.followup.send(embed=embed)
-
-            # Send notification to user
-            notification_channel_id = await self.channel_config.get_notification_channel(interaction.guild.id)
-            if notification_channel_id:
-                notification_channel = interaction.guild.get_channel(notification_channel_id)
-                if notification_channel:
-                    user_embed = discord.Embed(
-                        title="Quest Approved!",
-                        description=f"Congratulations! Your quest **{quest.title}** has been approved!",
-                        color=discord.Color.green()
-                    )
+            # Build the confirmation and notification embeds together
+            embed, user_embed = self._build_approval_embeds(quest, user_mention, interaction.user, approved=True)
 
-                    if quest.reward:
-                        user_embed.add_field(name="Reward", value=quest.reward, inline=False)
-
-                    user_embed.set_footer(text=f"Approved by {interaction.user.display_name}")
-
-                    await notification_channel.send(f"{user.mention if user else f'<@{user_id}>'}", embed=user_embed)
-
-            # Update user stats
-            await self.user_stats_manager.update_quest_completed(user_id_int, interaction.guild.id)
+            # Confirmation, stats update and user notification are independent —
+            # run them concurrently so latency is max() rather than sum()
+            await asyncio.gather(
+                interaction.edit_original_response(content=None, embed=embed),
+                self.user_stats_manager.update_quest_completed(user_id_int, interaction.guild.id),
+                self._send_notification(interaction.guild, user, user_id, user_embed)
+            )
 
         elif action == "reject":
             # Validate quest can be rejected
             if progress.status != "completed":
-                await interaction.followup.send("Quest is not ready for rejection!", ephemeral=True)
+                await interaction.edit_original_response(content="Quest is not ready for rejection!")
                 return
 
             # Reject the quest
-            rejected_progress = await self.quest_manager.approve_quest(quest_id, user_id_int, approved=False)
+            rejected_progress = await self.quest_manager.approve_quest(quest_id, user_id_int, approved=False, progress=progress)
             if not rejected_progress:
-                await interaction.followup.send("Failed to reject quest!", ephemeral=True)
+                await interaction.edit_original_response(content="Failed to reject quest!")
                 return
 
-            # Create rejection confirmation embed
-            embed = discord.Embed(
-                title="Quest Rejected",
-                description=f"Quest **{quest.title}** has been rejected for {user.mention if user else f'User {user_id}'}",
-                color=discord.Color.red()
-            )
-
-            embed.add_field(name="Quest ID", value=f"`{quest.quest_id}`", inline=True)
-            embed.add_field(name="User", value=user.mention if user else f"User {user_id}", inline=True)
-            embed.add_field(name="Note", value="User can attempt again in 24 hours", inline=False)
-
-            embed.set_footer(text=f"Rejected by {interaction.user.display_name}")
+            # Build the confirmation and notification embeds together
+            embed, user_embed = self._build_approval_embeds(quest, user_mention, interaction.user, approved=False)
 
-            await interaction.followup.send(embed=embed)
-
-            # Send notification to user
-            notification_channel_id = await self.channel_config.get_notification_channel(interaction.guild.id)
-            if notification_channel_id:
-                notification_channel = interaction.guild.get_channel(notification_channel_id)
-                if notification_channel:
-                    user_embed = discord.Embed(
-                        title="Quest Rejected",
-                        description=f"Your quest **{quest.title}** has been rejected. You can try again in 24 hours.",
-                        color=discord.Color.red()
-                    )
-
-                    user_embed.set_footer(text=f"Rejected by {interaction.user.display_name}")
-
-                    await notification_channel.send(f"{user.mention if user else f'<@{user_id}>'}", embed=user_embed)
-
-            # Update user stats
-            await self.user_stats_manager.update_quest_rejected(user_id_int, interaction.guild.id)
+            # Confirmation, stats update and user notification are independent —
+            # run them concurrently so latency is max() rather than sum()
+            await asyncio.gather(
+                interaction.edit_original_response(content=None, embed=embed),
+                self.user_stats_manager.update_quest_rejected(user_id_int, interaction.guild.id),
+                self._send_notification(interaction.guild, user, user_id, user_embed)
+            )
 
     @app_commands.command(name="delete_quest", description="Delete a quest")
     @app_commands.describe(quest_id="The ID of the quest to delete")
@@ -928,11 +976,11 @@ class QuestCommands(commands.Cog):
 
         embed.add_field(name="Completion Rate", value=f"{completion_rate:.1f}%", inline=True)
 
-        if stats.first_quest_date:
-            embed.add_field(name="First Quest", value=f"<t:{int(datetime.fromisoformat(stats.first_quest_date).timestamp())}:D>", inline=True)
+        if stats.first_quest_ts:
+            embed.add_field(name="First Quest", value=f"<t:{stats.first_quest_ts}:D>", inline=True)
 
-        if stats.last_quest_date:
-            embed.add_field(name="Last Quest", value=f"<t:{int(datetime.fromisoformat(stats.last_quest_date).timestamp())}:D>", inline=True)
+        if stats.last_quest_ts:
+            embed.add_field(name="Last Quest", value=f"<t:{stats.last_quest_ts}:D>", inline=True)
 
         await interaction.response.send_message(embed=embed)
 
@@ -940,24 +988,42 @@ class QuestCommands(commands.Cog):
     @app_commands.describe(limit="Number of users to show (default: 10)")
     async def leaderboard(self, interaction: discord.Interaction, limit: Optional[int] = 10):
         """View quest leaderboard"""
-        if limit and limit > 25:
-            limit = 25
+        # Clamp to [1, 25] in one expression; also guards zero/negative input
+        limit = min(max(int(limit or 10), 1), 25)
 
-        stats_list = await self.user_stats_manager.get_guild_leaderboard(interaction.guild.id, limit or 10)
+        # One query returns both the top-N list and the guild totals
+        stats_list, guild_stats = await self.user_stats_manager.get_guild_leaderboard_with_totals(
+            interaction.guild.id, limit
+        )
 
         if not stats_list:
             await interaction.response.send_message("No quest statistics found!", ephemeral=True)
             return
 
+        # Ack inside the 3-second window: the member batch-fetch below is
+        # a gateway round-trip that can take seconds on a cold cache
+        await interaction.response.defer()
+
         embed = discord.Embed(
             title="Quest Leaderboard",
             description=f"Top {len(stats_list)} quest completers",
             color=discord.Color.gold()
         )
 
+        # Build the display-name map in one pass over the member cache,
+        # batch-fetching anyone missing in a single gateway request
+        guild = interaction.guild
+        name_map = {m.id: m.display_name for m in guild.members}
+        missing = [stats.user_id for stats in stats_list if stats.user_id not in name_map]
+        if missing:
+            try:
+                members = await guild.query_members(user_ids=missing, limit=min(len(missing), 100))
+                name_map.update({m.id: m.display_name for m in members})
+            except Exception:
+                pass
+
         for i, stats in enumerate(stats_list, 1):
-            user = interaction.guild.get_member(stats.user_id)
-            user_display = user.display_name if user else f"User {stats.user_id}"
+            user_display = name_map.get(stats.user_id, f"User {stats.user_id}")
 
             embed.add_field(
                 name=f"{i}. {user_display}",
@@ -966,14 +1032,13 @@ class QuestCommands(commands.Cog):
             )
 
         # Add guild totals
-        guild_stats = await self.user_stats_manager.get_total_guild_stats(interaction.guild.id)
         embed.add_field(
             name="Guild Totals",
             value=f"Total Completed: {guild_stats['total_completed']}\nTotal Accepted: {guild_stats['total_accepted']}\nActive Users: {guild_stats['active_users']}",
             inline=False
         )
 
-        await interaction.response.send_message(embed=embed)
+        await interaction.followup.send(embed=embed)
 
 
 async def setup(bot):
@@ -1,20 +1,62 @@
-from typing import Optional, Dict
+import asyncio
+import time
+from dataclasses import asdict
+from typing import Optional, Dict, Tuple
+
+import discord
+
 from bot.json_database import JSONDatabase
 from bot.models import ChannelConfig as ChannelConfigModel
 
+# How long cached channel configs stay valid before re-reading the database
+_CACHE_TTL = 60.0
+
 
 class ChannelConfig:
     """Channel configuration management"""
-    
+
     def __init__(self, database: JSONDatabase):
         self.database = database
-    
+        # guild_id -> (expiry, config); channel config changes rarely, so a
+        # short TTL keeps hot command paths off the database
+        self._cache: Dict[int, Tuple[float, Optional[ChannelConfigModel]]] = {}
+        # In-flight lookups per guild so concurrent cold misses share one read
+        self._inflight: Dict[int, asyncio.Future] = {}
+        # Resolved notification channel objects, so the notification flow
+        # doesn't re-walk guild.channels on every approval
+        self._notification_channels: Dict[int, discord.abc.GuildChannel] = {}
+
     async def initialize(self):
-        """Initialize config"""
-        # Database tables are created during database initialization
-        pass
-    
-    async def set_guild_channels(self, guild_id: int, quest_list_channel: int = None, 
+        """Preload every stored guild config so first lookups hit the cache"""
+        expiry = time.monotonic() + _CACHE_TTL
+        for config in await self.database.load_all_channel_configs():
+            self._cache[config.guild_id] = (expiry, config)
+
+    async def _get_config(self, guild_id: int) -> Optional[ChannelConfigModel]:
+        """Get the channel configuration for a guild, using the TTL cache"""
+        cached = self._cache.get(guild_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        # Coalesce concurrent misses onto a single database read
+        inflight = self._inflight.get(guild_id)
+        if inflight is not None:
+            return await inflight
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[guild_id] = future
+        try:
+            config = await self.database.get_channel_config(guild_id)
+            self._cache[guild_id] = (time.monotonic() + _CACHE_TTL, config)
+            future.set_result(config)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            self._inflight.pop(guild_id, None)
+        return config
+
+    async def set_guild_channels(self, guild_id: int, quest_list_channel: int = None,
                                 quest_accept_channel: int = None, quest_submit_channel: int = None,
                                 quest_approval_channel: int = None, notification_channel: int = None):
         """Set channel configuration for a guild"""
@@ -27,41 +69,65 @@ class ChannelConfig:
             notification_channel=notification_channel
         )
         await self.database.save_channel_config(config)
-    
+        # Write through so the next lookup doesn't have to re-read the database
+        self._cache[guild_id] = (time.monotonic() + _CACHE_TTL, config)
+        self._notification_channels.pop(guild_id, None)
+
+    async def get_model(self, guild_id: int) -> Optional[ChannelConfigModel]:
+        """Get the channel configuration model for a guild (cached)
+
+        Prefer this over get_guild_config when several channels are needed:
+        the model is returned directly with no per-call dict copy.
+        """
+        return await self._get_config(guild_id)
+
     async def get_guild_config(self, guild_id: int) -> Dict[str, int]:
-        """Get channel configuration for a guild"""
-        config = await self.database.get_channel_config(guild_id)
-        if config:
-            return {
-                'quest_list_channel': config.quest_list_channel,
-                'quest_accept_channel': config.quest_accept_channel,
-                'quest_submit_channel': config.quest_submit_channel,
-                'quest_approval_channel': config.quest_approval_channel,
-                'notification_channel': config.notification_channel
-            }
-        return {}
-    
+        """Get channel configuration for a guild as a dict"""
+        config = await self._get_config(guild_id)
+        return asdict(config) if config else {}
+
     async def get_quest_list_channel(self, guild_id: int) -> Optional[int]:
         """Get quest list channel for a guild"""
-        config = await self.database.get_channel_config(guild_id)
+        config = await self._get_config(guild_id)
         return config.quest_list_channel if config else None
-    
+
     async def get_quest_accept_channel(self, guild_id: int) -> Optional[int]:
         """Get quest accept channel for a guild"""
-        config = await self.database.get_channel_config(guild_id)
+        config = await self._get_config(guild_id)
         return config.quest_accept_channel if config else None
-    
+
     async def get_quest_submit_channel(self, guild_id: int) -> Optional[int]:
         """Get quest submit channel for a guild"""
-        config = await self.database.get_channel_config(guild_id)
+        config = await self._get_config(guild_id)
         return config.quest_submit_channel if config else None
-    
+
     async def get_quest_approval_channel(self, guild_id: int) -> Optional[int]:
         """Get quest approval channel for a guild"""
-        config = await self.database.get_channel_config(guild_id)
+        config = await self._get_config(guild_id)
         return config.quest_approval_channel if config else None
-    
+
     async def get_notification_channel(self, guild_id: int) -> Optional[int]:
         """Get notification channel for a guild"""
-        config = await self.database.get_channel_config(guild_id)
-        return config.notification_channel if config else None
\ No newline at end of file
+        config = await self._get_config(guild_id)
+        return config.notification_channel if config else None
+
+    async def get_notification_channel_obj(self, guild: discord.Guild) -> Optional[discord.abc.GuildChannel]:
+        """Get the resolved notification channel object for a guild (cached)"""
+        channel = self._notification_channels.get(guild.id)
+        if channel is not None:
+            return channel
+
+        channel_id = await self.get_notification_channel(guild.id)
+        if not channel_id:
+            return None
+
+        channel = guild.get_channel(channel_id)
+        if channel is not None:
+            self._notification_channels[guild.id] = channel
+        return channel
+
+    def invalidate_channel_obj(self, guild_id: int, channel_id: int):
+        """Drop a cached channel object, e.g. when the channel is deleted"""
+        cached = self._notification_channels.get(guild_id)
+        if cached is not None and cached.id == channel_id:
+            del self._notification_channels[guild_id]
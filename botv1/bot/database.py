@@ -1,372 +1,611 @@
 import asyncpg
 import os
 import json
+import time
 from typing import List, Optional, Dict, Any
 from bot.models import Quest, QuestProgress, UserStats, ChannelConfig
 
 
+# Explicit projections in model field order — no SELECT * so the wire
+# payload carries only columns the models actually use
+QUEST_COLUMNS = ('quest_id, title, description, creator_id, guild_id, requirements, '
+                 'reward, rank, category, status, created_at, required_role_ids')
+PROGRESS_COLUMNS = ('quest_id, user_id, guild_id, status, accepted_at, completed_at, '
+                    'proof_text, proof_image_urls, approval_status, accepted_channel_id')
+STATS_COLUMNS = ('user_id, guild_id, quests_completed, quests_accepted, quests_rejected, '
+                 'first_quest_date, last_quest_date')
+CONFIG_COLUMNS = ('guild_id, quest_list_channel, quest_accept_channel, quest_submit_channel, '
+                  'quest_approval_channel, notification_channel')
+
+# SQL for the hottest queries lives at module level so the per-connection
+# prepared-statement cache can key on string identity
+SQL_GET_QUEST = f'SELECT {QUEST_COLUMNS} FROM quests WHERE quest_id = $1'
+
+# UNIQUE(quest_id, user_id) means at most one row; no sort/limit needed
+SQL_GET_USER_QUEST_PROGRESS = f'''
+    SELECT {PROGRESS_COLUMNS} FROM quest_progress
+    WHERE user_id = $1 AND quest_id = $2
+'''
+
+SQL_GET_USER_STATS = f'''
+    SELECT {STATS_COLUMNS} FROM user_stats WHERE user_id = $1 AND guild_id = $2
+'''
+
+SQL_GET_CHANNEL_CONFIG = f'''
+    SELECT {CONFIG_COLUMNS} FROM channel_config WHERE guild_id = $1
+'''
+
+SQL_LOAD_ALL_CHANNEL_CONFIGS = f'SELECT {CONFIG_COLUMNS} FROM channel_config'
+
+SQL_INCREMENT_USER_STATS = '''
+    INSERT INTO user_stats (user_id, guild_id, quests_completed, quests_accepted,
+                          quests_rejected, first_quest_date, last_quest_date)
+    VALUES ($1, $2, $3, $4, $5, NOW(), NOW())
+    ON CONFLICT (user_id, guild_id) DO UPDATE SET
+        quests_completed = user_stats.quests_completed + EXCLUDED.quests_completed,
+        quests_accepted = user_stats.quests_accepted + EXCLUDED.quests_accepted,
+        quests_rejected = user_stats.quests_rejected + EXCLUDED.quests_rejected,
+        last_quest_date = NOW()
+'''
+
+SQL_SAVE_QUEST = '''
+    INSERT INTO quests (quest_id, title, description, creator_id, guild_id,
+                      requirements, reward, rank, category, status, created_at, required_role_ids)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
+    ON CONFLICT (quest_id) DO UPDATE SET
+        title = EXCLUDED.title,
+        description = EXCLUDED.description,
+        requirements = EXCLUDED.requirements,
+        reward = EXCLUDED.reward,
+        rank = EXCLUDED.rank,
+        category = EXCLUDED.category,
+        status = EXCLUDED.status,
+        required_role_ids = EXCLUDED.required_role_ids
+'''
+
+SQL_SAVE_QUEST_PROGRESS = '''
+    INSERT INTO quest_progress (quest_id, user_id, guild_id, status, accepted_at,
+                              completed_at, proof_text, proof_image_urls, approval_status, accepted_channel_id)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+    ON CONFLICT (quest_id, user_id) DO UPDATE SET
+        status = EXCLUDED.status,
+        completed_at = EXCLUDED.completed_at,
+        proof_text = EXCLUDED.proof_text,
+        proof_image_urls = EXCLUDED.proof_image_urls,
+        approval_status = EXCLUDED.approval_status,
+        accepted_channel_id = EXCLUDED.accepted_channel_id
+'''
+
+SQL_GET_QUESTS_BY_IDS = f'SELECT {QUEST_COLUMNS} FROM quests WHERE quest_id = ANY($1)'
+
+SQL_GET_GUILD_QUESTS = f'SELECT {QUEST_COLUMNS} FROM quests WHERE guild_id = $1'
+
+SQL_GET_GUILD_QUESTS_BY_STATUS = f'SELECT {QUEST_COLUMNS} FROM quests WHERE guild_id = $1 AND status = $2'
+
+SQL_GET_AVAILABLE_QUESTS = f'''
+    SELECT {QUEST_COLUMNS} FROM quests
+    WHERE guild_id = $1 AND status = 'available'
+      AND ($2::varchar IS NULL OR rank = $2)
+      AND ($3::varchar IS NULL OR category = $3)
+    ORDER BY CASE rank
+        WHEN 'easy' THEN 0
+        WHEN 'normal' THEN 1
+        WHEN 'medium' THEN 2
+        WHEN 'hard' THEN 3
+        WHEN 'impossible' THEN 4
+        ELSE 1
+    END, created_at
+'''
+
+SQL_DELETE_QUEST = 'DELETE FROM quests WHERE quest_id = $1'
+
+SQL_GET_USER_QUESTS = f'''
+    SELECT {PROGRESS_COLUMNS} FROM quest_progress
+    WHERE user_id = $1
+    ORDER BY accepted_at DESC
+'''
+
+SQL_GET_USER_QUESTS_IN_GUILD = f'''
+    SELECT {PROGRESS_COLUMNS} FROM quest_progress
+    WHERE user_id = $1 AND guild_id = $2
+    ORDER BY accepted_at DESC
+'''
+
+SQL_GET_PENDING_APPROVALS = '''
+    SELECT quest_id, user_id, guild_id, creator_id, title,
+           proof_text, proof_image_urls, completed_at
+    FROM pending_approvals
+    WHERE creator_id = $1 AND guild_id = $2
+    ORDER BY completed_at ASC
+'''
+
+SQL_SAVE_USER_STATS = '''
+    INSERT INTO user_stats (user_id, guild_id, quests_completed, quests_accepted,
+                          quests_rejected, first_quest_date, last_quest_date)
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+    ON CONFLICT (user_id, guild_id) DO UPDATE SET
+        quests_completed = EXCLUDED.quests_completed,
+        quests_accepted = EXCLUDED.quests_accepted,
+        quests_rejected = EXCLUDED.quests_rejected,
+        last_quest_date = EXCLUDED.last_quest_date
+'''
+
+SQL_GET_GUILD_LEADERBOARD = f'''
+    SELECT {STATS_COLUMNS} FROM user_stats
+    WHERE guild_id = $1
+    ORDER BY quests_completed DESC, quests_accepted DESC
+    LIMIT $2
+'''
+
+SQL_GET_GUILD_LEADERBOARD_WITH_TOTALS = f'''
+    SELECT {STATS_COLUMNS},
+           SUM(quests_completed) OVER () AS total_completed,
+           SUM(quests_accepted) OVER () AS total_accepted,
+           COUNT(*) OVER () AS active_users
+    FROM user_stats
+    WHERE guild_id = $1
+    ORDER BY quests_completed DESC, quests_accepted DESC
+    LIMIT $2
+'''
+
+SQL_GET_TOTAL_GUILD_STATS = '''
+    SELECT
+        SUM(quests_completed) as total_completed,
+        SUM(quests_accepted) as total_accepted,
+        COUNT(*) as active_users
+    FROM user_stats
+    WHERE guild_id = $1
+'''
+
+SQL_SAVE_CHANNEL_CONFIG = '''
+    INSERT INTO channel_config (guild_id, quest_list_channel, quest_accept_channel,
+                              quest_submit_channel, quest_approval_channel, notification_channel)
+    VALUES ($1, $2, $3, $4, $5, $6)
+    ON CONFLICT (guild_id) DO UPDATE SET
+        quest_list_channel = EXCLUDED.quest_list_channel,
+        quest_accept_channel = EXCLUDED.quest_accept_channel,
+        quest_submit_channel = EXCLUDED.quest_submit_channel,
+        quest_approval_channel = EXCLUDED.quest_approval_channel,
+        notification_channel = EXCLUDED.notification_channel
+'''
+
+
+SQL_CREATE_TABLES = '''
+    CREATE TABLE IF NOT EXISTS quests (
+        quest_id VARCHAR PRIMARY KEY,
+        title VARCHAR NOT NULL,
+        description TEXT NOT NULL,
+        creator_id BIGINT NOT NULL,
+        guild_id BIGINT NOT NULL,
+        requirements TEXT DEFAULT '',
+        reward TEXT DEFAULT '',
+        rank VARCHAR DEFAULT 'normal',
+        category VARCHAR DEFAULT 'other',
+        status VARCHAR DEFAULT 'available',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        required_role_ids BIGINT[] DEFAULT '{}'
+    );
+
+    CREATE TABLE IF NOT EXISTS quest_progress (
+        id SERIAL PRIMARY KEY,
+        quest_id VARCHAR NOT NULL,
+        user_id BIGINT NOT NULL,
+        guild_id BIGINT NOT NULL,
+        status VARCHAR DEFAULT 'accepted',
+        accepted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        completed_at TIMESTAMP,
+        proof_text TEXT DEFAULT '',
+        proof_image_urls TEXT[] DEFAULT '{}',
+        approval_status VARCHAR DEFAULT '',
+        accepted_channel_id BIGINT,
+        FOREIGN KEY (quest_id) REFERENCES quests(quest_id) ON DELETE CASCADE,
+        UNIQUE(quest_id, user_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS user_stats (
+        id SERIAL PRIMARY KEY,
+        user_id BIGINT NOT NULL,
+        guild_id BIGINT NOT NULL,
+        quests_completed INTEGER DEFAULT 0,
+        quests_accepted INTEGER DEFAULT 0,
+        quests_rejected INTEGER DEFAULT 0,
+        first_quest_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_quest_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(user_id, guild_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS channel_config (
+        guild_id BIGINT PRIMARY KEY,
+        quest_list_channel BIGINT,
+        quest_accept_channel BIGINT,
+        quest_submit_channel BIGINT,
+        quest_approval_channel BIGINT,
+        notification_channel BIGINT
+    );
+
+    -- Available-quest listing (filter + sort server-side); the
+    -- (guild_id, status) prefix also serves the guild-quest filters
+    CREATE INDEX IF NOT EXISTS idx_quests_guild_status_rank_created
+    ON quests(guild_id, status, rank, created_at);
+
+    -- User quest history: filter + sort straight off the index
+    CREATE INDEX IF NOT EXISTS idx_qp_user_guild_time
+    ON quest_progress(user_id, guild_id, accepted_at DESC);
+
+    -- Denormalized approval queue kept in sync by trigger, so the
+    -- pending-approvals command is a single index read with no join
+    CREATE TABLE IF NOT EXISTS pending_approvals (
+        quest_id VARCHAR NOT NULL,
+        user_id BIGINT NOT NULL,
+        guild_id BIGINT NOT NULL,
+        creator_id BIGINT NOT NULL,
+        title VARCHAR NOT NULL,
+        proof_text TEXT DEFAULT '',
+        proof_image_urls TEXT[] DEFAULT '{}',
+        completed_at TIMESTAMP,
+        PRIMARY KEY (quest_id, user_id),
+        FOREIGN KEY (quest_id) REFERENCES quests(quest_id) ON DELETE CASCADE
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_pending_creator
+    ON pending_approvals(creator_id, guild_id, completed_at);
+
+    CREATE OR REPLACE FUNCTION sync_pending_approvals() RETURNS trigger AS $$
+    BEGIN
+        IF NEW.status = 'completed' THEN
+            INSERT INTO pending_approvals (quest_id, user_id, guild_id, creator_id,
+                                           title, proof_text, proof_image_urls, completed_at)
+            SELECT NEW.quest_id, NEW.user_id, NEW.guild_id, q.creator_id,
+                   q.title, NEW.proof_text, NEW.proof_image_urls, NEW.completed_at
+            FROM quests q WHERE q.quest_id = NEW.quest_id
+            ON CONFLICT (quest_id, user_id) DO UPDATE SET
+                proof_text = EXCLUDED.proof_text,
+                proof_image_urls = EXCLUDED.proof_image_urls,
+                completed_at = EXCLUDED.completed_at;
+        ELSE
+            DELETE FROM pending_approvals
+            WHERE quest_id = NEW.quest_id AND user_id = NEW.user_id;
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    DROP TRIGGER IF EXISTS trg_qp_sync_pending ON quest_progress;
+    CREATE TRIGGER trg_qp_sync_pending
+    AFTER INSERT OR UPDATE OF status ON quest_progress
+    FOR EACH ROW EXECUTE FUNCTION sync_pending_approvals();
+
+    INSERT INTO pending_approvals (quest_id, user_id, guild_id, creator_id,
+                                   title, proof_text, proof_image_urls, completed_at)
+    SELECT qp.quest_id, qp.user_id, qp.guild_id, q.creator_id,
+           q.title, qp.proof_text, qp.proof_image_urls, qp.completed_at
+    FROM quest_progress qp
+    JOIN quests q ON q.quest_id = qp.quest_id
+    WHERE qp.status = 'completed'
+    ON CONFLICT (quest_id, user_id) DO NOTHING;
+
+    -- Leaderboard: ORDER BY ... LIMIT becomes a top-N index scan
+    CREATE INDEX IF NOT EXISTS idx_stats_leaderboard
+    ON user_stats(guild_id, quests_completed DESC, quests_accepted DESC);
+'''
+
+
 class Database:
     """PostgreSQL database interface for the quest bot"""
-    
+
+    # How long cached channel configs stay valid before re-reading Postgres
+    _CHANNEL_CFG_TTL = 60.0
+
     def __init__(self):
         self.pool = None
         self.database_url = os.getenv('DATABASE_URL')
-        
+        # guild_id -> (expiry, config); None is cached too, so guilds without
+        # a config don't hit the database on every interaction
+        self._channel_cfg_cache = {}
+
     async def initialize(self):
         """Initialize the database connection and create tables"""
         if not self.database_url:
             raise ValueError("DATABASE_URL environment variable not set")
-        
-        # Create connection pool
+
+        # Create connection pool. Pre-warmed min_size avoids connect latency
+        # on the first burst; max_size=25 keeps concurrent interactions from
+        # queueing on a pool slot without overwhelming Postgres
         self.pool = await asyncpg.create_pool(
             self.database_url,
-            min_size=1,
-            max_size=10,
-            command_timeout=60
+            min_size=10,
+            max_size=25,
+            max_inactive_connection_lifetime=300,
+            command_timeout=60,
+            init=self._init_conn
         )
-        
+
         # Create tables
         await self.create_tables()
+
+    @staticmethod
+    async def _init_conn(conn):
+        """Apply server-side session tuning once per new connection"""
+        # JIT compilation never pays off for these short OLTP queries
+        await conn.execute("SET jit = off; SET application_name = 'questbot';")
+
+    # The module-level SQL constants mean every query is a stable string,
+    # so asyncpg's built-in per-connection statement cache reuses the
+    # prepared plan on repeat calls - no Parse/Bind round-trip after the
+    # first use of each statement on a connection.
+
+    async def _fetchrow_prepared(self, sql: str, *args):
+        """fetchrow via the pool's per-connection statement cache"""
+        return await self.pool.fetchrow(sql, *args)
+
+    async def _fetch_prepared(self, sql: str, *args):
+        """fetch via the pool's per-connection statement cache"""
+        return await self.pool.fetch(sql, *args)
+
+    async def _execute_prepared(self, sql: str, *args):
+        """execute via the pool's per-connection statement cache"""
+        await self.pool.execute(sql, *args)
     
     async def create_tables(self):
         """Create all necessary tables"""
+        # One multi-statement batch: a single round-trip instead of one per
+        # CREATE, wrapped in a transaction so startup DDL is all-or-nothing
         async with self.pool.acquire() as conn:
-            # Create quests table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS quests (
-                    quest_id VARCHAR PRIMARY KEY,
-                    title VARCHAR NOT NULL,
-                    description TEXT NOT NULL,
-                    creator_id BIGINT NOT NULL,
-                    guild_id BIGINT NOT NULL,
-                    requirements TEXT DEFAULT '',
-                    reward TEXT DEFAULT '',
-                    rank VARCHAR DEFAULT 'normal',
-                    category VARCHAR DEFAULT 'other',
-                    status VARCHAR DEFAULT 'available',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    required_role_ids BIGINT[] DEFAULT '{}'
-                )
-            ''')
-            
-            # Create quest progress table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS quest_progress (
-                    id SERIAL PRIMARY KEY,
-                    quest_id VARCHAR NOT NULL,
-                    user_id BIGINT NOT NULL,
-                    guild_id BIGINT NOT NULL,
-                    status VARCHAR DEFAULT 'accepted',
-                    accepted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    completed_at TIMESTAMP,
-                    proof_text TEXT DEFAULT '',
-                    proof_image_urls TEXT[] DEFAULT '{}',
-                    approval_status VARCHAR DEFAULT '',
-                    accepted_channel_id BIGINT,
-                    FOREIGN KEY (quest_id) REFERENCES quests(quest_id) ON DELETE CASCADE,
-                    UNIQUE(quest_id, user_id)
-                )
-            ''')
-            
-            # Create user stats table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS user_stats (
-                    id SERIAL PRIMARY KEY,
-                    user_id BIGINT NOT NULL,
-                    guild_id BIGINT NOT NULL,
-                    quests_completed INTEGER DEFAULT 0,
-                    quests_accepted INTEGER DEFAULT 0,
-                    quests_rejected INTEGER DEFAULT 0,
-                    first_quest_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_quest_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(user_id, guild_id)
-                )
-            ''')
-            
-            # Create channel config table
-            await conn.execute('''
-                CREATE TABLE IF NOT EXISTS channel_config (
-                    guild_id BIGINT PRIMARY KEY,
-                    quest_list_channel BIGINT,
-                    quest_accept_channel BIGINT,
-                    quest_submit_channel BIGINT,
-                    quest_approval_channel BIGINT,
-                    notification_channel BIGINT
-                )
-            ''')
-    
+            async with conn.transaction():
+                await conn.execute(SQL_CREATE_TABLES)
+
+    @staticmethod
+    def _quest_from_row(row) -> Quest:
+        """Hydrate a Quest from a Record, building the role set directly
+
+        required_role_ids is only ever iterated or membership-tested, so a
+        frozenset skips a list allocation and makes the checks O(1).
+        """
+        return Quest(*row[:11], frozenset(row[11]) if row[11] else frozenset())
+
+    @staticmethod
+    def _quest_row(quest: Quest) -> tuple:
+        """Build the parameter tuple for SQL_SAVE_QUEST"""
+        return (quest.quest_id, quest.title, quest.description, quest.creator_id, quest.guild_id,
+                quest.requirements, quest.reward, quest.rank, quest.category, quest.status,
+                quest.created_at, list(quest.required_role_ids))
+
+    @staticmethod
+    def _progress_row(progress: QuestProgress) -> tuple:
+        """Build the parameter tuple for SQL_SAVE_QUEST_PROGRESS"""
+        return (progress.quest_id, progress.user_id, progress.guild_id, progress.status,
+                progress.accepted_at, progress.completed_at, progress.proof_text,
+                progress.proof_image_urls, progress.approval_status, progress.accepted_channel_id)
+
     async def save_quest(self, quest: Quest):
         """Save a quest to the database"""
+        await self._execute_prepared(SQL_SAVE_QUEST, *self._quest_row(quest))
+
+    async def save_quests_bulk(self, quests: List[Quest]):
+        """Save many quests in one round-trip via executemany"""
+        if not quests:
+            return
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(SQL_SAVE_QUEST, [self._quest_row(q) for q in quests])
+
+    async def save_quest_progress_bulk(self, progresses: List[QuestProgress]):
+        """Save many progress rows in one round-trip via executemany"""
+        if not progresses:
+            return
         async with self.pool.acquire() as conn:
-            await conn.execute('''
-                INSERT INTO quests (quest_id, title, description, creator_id, guild_id, 
-                                  requirements, reward, rank, category, status, created_at, required_role_ids)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-                ON CONFLICT (quest_id) DO UPDATE SET
-                    title = EXCLUDED.title,
-                    description = EXCLUDED.description,
-                    requirements = EXCLUDED.requirements,
-                    reward = EXCLUDED.reward,
-                    rank = EXCLUDED.rank,
-                    category = EXCLUDED.category,
-                    status = EXCLUDED.status,
-                    required_role_ids = EXCLUDED.required_role_ids
-            ''', quest.quest_id, quest.title, quest.description, quest.creator_id, quest.guild_id,
-                quest.requirements, quest.reward, quest.rank, quest.category, quest.status, 
-                quest.created_at, quest.required_role_ids)
+            async with conn.transaction():
+                await conn.executemany(SQL_SAVE_QUEST_PROGRESS, [self._progress_row(p) for p in progresses])
     
     async def get_quest(self, quest_id: str) -> Optional[Quest]:
         """Get a quest by ID"""
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow('SELECT * FROM quests WHERE quest_id = $1', quest_id)
-            if row:
-                return Quest(
-                    quest_id=row['quest_id'],
-                    title=row['title'],
-                    description=row['description'],
-                    creator_id=row['creator_id'],
-                    guild_id=row['guild_id'],
-                    requirements=row['requirements'],
-                    reward=row['reward'],
-                    rank=row['rank'],
-                    category=row['category'],
-                    status=row['status'],
-                    created_at=row['created_at'] if row['created_at'] else None,
-                    required_role_ids=list(row['required_role_ids']) if row['required_role_ids'] else []
-                )
-            return None
+        row = await self._fetchrow_prepared(SQL_GET_QUEST, quest_id)
+        if row:
+            # QUEST_COLUMNS matches Quest's field order, so the Record
+            # star-unpacks straight into the dataclass
+            return self._quest_from_row(row)
+        return None
     
+    async def get_quests_by_ids(self, quest_ids: List[str]) -> Dict[str, Quest]:
+        """Get multiple quests by ID in a single query"""
+        if not quest_ids:
+            return {}
+        rows = await self._fetch_prepared(SQL_GET_QUESTS_BY_IDS, quest_ids)
+        return {row[0]: self._quest_from_row(row) for row in rows}
+
     async def get_guild_quests(self, guild_id: int, status: str = None) -> List[Quest]:
         """Get all quests for a guild, optionally filtered by status"""
-        async with self.pool.acquire() as conn:
-            if status:
-                rows = await conn.fetch('SELECT * FROM quests WHERE guild_id = $1 AND status = $2', guild_id, status)
-            else:
-                rows = await conn.fetch('SELECT * FROM quests WHERE guild_id = $1', guild_id)
-            
-            quests = []
-            for row in rows:
-                quest = Quest(
-                    quest_id=row['quest_id'],
-                    title=row['title'],
-                    description=row['description'],
-                    creator_id=row['creator_id'],
-                    guild_id=row['guild_id'],
-                    requirements=row['requirements'],
-                    reward=row['reward'],
-                    rank=row['rank'],
-                    category=row['category'],
-                    status=row['status'],
-                    created_at=row['created_at'] if row['created_at'] else None,
-                    required_role_ids=list(row['required_role_ids']) if row['required_role_ids'] else []
-                )
-                quests.append(quest)
-            return quests
+        if status:
+            rows = await self._fetch_prepared(SQL_GET_GUILD_QUESTS_BY_STATUS, guild_id, status)
+        else:
+            rows = await self._fetch_prepared(SQL_GET_GUILD_QUESTS, guild_id)
+
+        return [self._quest_from_row(row) for row in rows]
     
+    async def iter_guild_quests(self, guild_id: int, status: str = None):
+        """Stream a guild's quests without materializing the full result set
+
+        conn.cursor fetches in batches inside a transaction, so memory stays
+        flat however many quests a guild has. Prefer this over
+        get_guild_quests when rows are consumed incrementally.
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                if status:
+                    cursor = conn.cursor(SQL_GET_GUILD_QUESTS_BY_STATUS, guild_id, status)
+                else:
+                    cursor = conn.cursor(SQL_GET_GUILD_QUESTS, guild_id)
+                async for row in cursor:
+                    yield self._quest_from_row(row)
+
+    async def get_available_quests(self, guild_id: int, rank: str = None, category: str = None) -> List[Quest]:
+        """Get available quests for a guild with filtering and ordering in SQL"""
+        rows = await self._fetch_prepared(SQL_GET_AVAILABLE_QUESTS, guild_id, rank, category)
+
+        return [self._quest_from_row(row) for row in rows]
+
     async def delete_quest(self, quest_id: str):
         """Delete a quest"""
-        async with self.pool.acquire() as conn:
-            await conn.execute('DELETE FROM quests WHERE quest_id = $1', quest_id)
+        await self.pool.execute(SQL_DELETE_QUEST, quest_id)
     
     async def save_quest_progress(self, progress: QuestProgress):
         """Save quest progress to the database"""
-        async with self.pool.acquire() as conn:
-            await conn.execute('''
-                INSERT INTO quest_progress (quest_id, user_id, guild_id, status, accepted_at, 
-                                          completed_at, proof_text, proof_image_urls, approval_status, accepted_channel_id)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                ON CONFLICT (quest_id, user_id) DO UPDATE SET
-                    status = EXCLUDED.status,
-                    completed_at = EXCLUDED.completed_at,
-                    proof_text = EXCLUDED.proof_text,
-                    proof_image_urls = EXCLUDED.proof_image_urls,
-                    approval_status = EXCLUDED.approval_status,
-                    accepted_channel_id = EXCLUDED.accepted_channel_id
-            ''', progress.quest_id, progress.user_id, progress.guild_id, progress.status, 
-                progress.accepted_at, progress.completed_at, progress.proof_text, 
-                progress.proof_image_urls, progress.approval_status, progress.accepted_channel_id)
+        await self._execute_prepared(SQL_SAVE_QUEST_PROGRESS, *self._progress_row(progress))
     
+    async def save_progress_with_stats(self, progress: QuestProgress, completed_delta: int = 0,
+                                       accepted_delta: int = 0, rejected_delta: int = 0):
+        """Persist progress and apply stat deltas in one transaction
+
+        The submit/approve flow otherwise pays two COMMITs — two WAL fsyncs —
+        for what is logically one state change.
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(SQL_SAVE_QUEST_PROGRESS, *self._progress_row(progress))
+                await conn.execute(SQL_INCREMENT_USER_STATS,
+                                   progress.user_id, progress.guild_id,
+                                   completed_delta, accepted_delta, rejected_delta)
+
+    async def patch_quest_progress(self, user_id: int, quest_id: str, **fields):
+        """Update a subset of progress columns directly
+
+        Column names are sorted so each field combination maps to one SQL
+        string, keeping the per-connection statement cache effective.
+        """
+        cols = sorted(fields)
+        assignments = ', '.join(f'{col} = ${i + 3}' for i, col in enumerate(cols))
+        sql = f'UPDATE quest_progress SET {assignments} WHERE user_id = $1 AND quest_id = $2'
+        await self._execute_prepared(sql, user_id, quest_id, *(fields[col] for col in cols))
+
     async def get_user_quest_progress(self, user_id: int, quest_id: str) -> Optional[QuestProgress]:
         """Get most recent progress for a specific user and quest"""
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow('''
-                SELECT * FROM quest_progress 
-                WHERE user_id = $1 AND quest_id = $2 
-                ORDER BY accepted_at DESC LIMIT 1
-            ''', user_id, quest_id)
-            
-            if row:
-                return QuestProgress(
-                    quest_id=row['quest_id'],
-                    user_id=row['user_id'],
-                    guild_id=row['guild_id'],
-                    status=row['status'],
-                    accepted_at=row['accepted_at'] if row['accepted_at'] else None,
-                    completed_at=row['completed_at'] if row['completed_at'] else None,
-                    proof_text=row['proof_text'],
-                    proof_image_urls=list(row['proof_image_urls']) if row['proof_image_urls'] else [],
-                    approval_status=row['approval_status'],
-                    accepted_channel_id=row['accepted_channel_id']
-                )
-            return None
+        row = await self._fetchrow_prepared(SQL_GET_USER_QUEST_PROGRESS, user_id, quest_id)
+        if row:
+            return QuestProgress(*row)
+        return None
     
     async def get_user_quests(self, user_id: int, guild_id: int = None) -> List[QuestProgress]:
         """Get all quests for a user"""
-        async with self.pool.acquire() as conn:
-            if guild_id:
-                rows = await conn.fetch('''
-                    SELECT * FROM quest_progress 
-                    WHERE user_id = $1 AND guild_id = $2 
-                    ORDER BY accepted_at DESC
-                ''', user_id, guild_id)
-            else:
-                rows = await conn.fetch('''
-                    SELECT * FROM quest_progress 
-                    WHERE user_id = $1 
-                    ORDER BY accepted_at DESC
-                ''', user_id)
-            
-            progresses = []
-            for row in rows:
-                progress = QuestProgress(
-                    quest_id=row['quest_id'],
-                    user_id=row['user_id'],
-                    guild_id=row['guild_id'],
-                    status=row['status'],
-                    accepted_at=row['accepted_at'] if row['accepted_at'] else None,
-                    completed_at=row['completed_at'] if row['completed_at'] else None,
-                    proof_text=row['proof_text'],
-                    proof_image_urls=list(row['proof_image_urls']) if row['proof_image_urls'] else [],
-                    approval_status=row['approval_status'],
-                    accepted_channel_id=row['accepted_channel_id']
-                )
-                progresses.append(progress)
-            return progresses
+        if guild_id:
+            rows = await self._fetch_prepared(SQL_GET_USER_QUESTS_IN_GUILD, user_id, guild_id)
+        else:
+            rows = await self._fetch_prepared(SQL_GET_USER_QUESTS, user_id)
+
+        return [QuestProgress(*row) for row in rows]
     
     async def get_pending_approvals(self, creator_id: int, guild_id: int) -> List[tuple]:
-        """Get quests pending approval for a quest creator"""
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch('''
-                SELECT qp.quest_id, qp.user_id, qp.proof_text, qp.proof_image_urls, q.title
-                FROM quest_progress qp
-                JOIN quests q ON qp.quest_id = q.quest_id
-                WHERE q.creator_id = $1 AND qp.guild_id = $2 AND qp.status = 'completed'
-                ORDER BY qp.completed_at ASC
-            ''', creator_id, guild_id)
-            
-            return [(row['quest_id'], row['user_id'], row['proof_text'], 
-                    list(row['proof_image_urls']) if row['proof_image_urls'] else [], 
-                    row['title']) for row in rows]
+        """Get (progress, quest) pairs pending approval for a quest creator
+
+        The join pulls every column both sides need so callers never issue a
+        follow-up get_quest per row.
+        """
+        rows = await self._fetch_prepared(SQL_GET_PENDING_APPROVALS, creator_id, guild_id)
+
+        pending = []
+        for row in rows:
+            progress = QuestProgress(
+                quest_id=row['quest_id'],
+                user_id=row['user_id'],
+                guild_id=row['guild_id'],
+                status='completed',
+                completed_at=row['completed_at'] if row['completed_at'] else None,
+                proof_text=row['proof_text'],
+                proof_image_urls=row['proof_image_urls'] or [],
+                approval_status='pending'
+            )
+            # Light quest header; the approvals listing only reads id/title
+            quest = Quest(
+                quest_id=row['quest_id'],
+                title=row['title'],
+                description='',
+                creator_id=row['creator_id'],
+                guild_id=row['guild_id']
+            )
+            pending.append((progress, quest))
+        return pending
     
+    async def increment_user_stats(self, user_id: int, guild_id: int,
+                                   completed_delta: int = 0, accepted_delta: int = 0,
+                                   rejected_delta: int = 0):
+        """Apply stat deltas atomically on the server side
+
+        One upsert instead of fetch-mutate-save: half the round-trips, and no
+        lost updates when two approvals race.
+        """
+        await self._execute_prepared(SQL_INCREMENT_USER_STATS, user_id, guild_id,
+                                     completed_delta, accepted_delta, rejected_delta)
+
     async def save_user_stats(self, stats: UserStats):
         """Save user statistics"""
-        async with self.pool.acquire() as conn:
-            await conn.execute('''
-                INSERT INTO user_stats (user_id, guild_id, quests_completed, quests_accepted, 
-                                      quests_rejected, first_quest_date, last_quest_date)
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
-                ON CONFLICT (user_id, guild_id) DO UPDATE SET
-                    quests_completed = EXCLUDED.quests_completed,
-                    quests_accepted = EXCLUDED.quests_accepted,
-                    quests_rejected = EXCLUDED.quests_rejected,
-                    last_quest_date = EXCLUDED.last_quest_date
-            ''', stats.user_id, stats.guild_id, stats.quests_completed, stats.quests_accepted,
-                stats.quests_rejected, stats.first_quest_date, stats.last_quest_date)
+        await self.pool.execute(SQL_SAVE_USER_STATS,
+            stats.user_id, stats.guild_id, stats.quests_completed, stats.quests_accepted,
+            stats.quests_rejected, stats.first_quest_date, stats.last_quest_date)
     
     async def get_user_stats(self, user_id: int, guild_id: int) -> Optional[UserStats]:
         """Get user statistics"""
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow('''
-                SELECT * FROM user_stats WHERE user_id = $1 AND guild_id = $2
-            ''', user_id, guild_id)
-            
-            if row:
-                return UserStats(
-                    user_id=row['user_id'],
-                    guild_id=row['guild_id'],
-                    quests_completed=row['quests_completed'],
-                    quests_accepted=row['quests_accepted'],
-                    quests_rejected=row['quests_rejected'],
-                    first_quest_date=row['first_quest_date'] if row['first_quest_date'] else None,
-                    last_quest_date=row['last_quest_date'] if row['last_quest_date'] else None
-                )
-            return None
+        row = await self._fetchrow_prepared(SQL_GET_USER_STATS, user_id, guild_id)
+        if row:
+            return UserStats(*row)
+        return None
     
     async def get_guild_leaderboard(self, guild_id: int, limit: int = 10) -> List[UserStats]:
         """Get guild leaderboard"""
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch('''
-                SELECT * FROM user_stats 
-                WHERE guild_id = $1 
-                ORDER BY quests_completed DESC, quests_accepted DESC 
-                LIMIT $2
-            ''', guild_id, limit)
-            
-            stats = []
-            for row in rows:
-                stat = UserStats(
-                    user_id=row['user_id'],
-                    guild_id=row['guild_id'],
-                    quests_completed=row['quests_completed'],
-                    quests_accepted=row['quests_accepted'],
-                    quests_rejected=row['quests_rejected'],
-                    first_quest_date=row['first_quest_date'] if row['first_quest_date'] else None,
-                    last_quest_date=row['last_quest_date'] if row['last_quest_date'] else None
-                )
-                stats.append(stat)
-            return stats
+        rows = await self._fetch_prepared(SQL_GET_GUILD_LEADERBOARD, guild_id, limit)
+        return [UserStats(*row) for row in rows]
     
+    async def get_guild_leaderboard_with_totals(self, guild_id: int, limit: int = 10):
+        """Get the top-N leaderboard plus guild-wide totals in one query
+
+        Window aggregates run over the full guild rowset before LIMIT, so the
+        totals ride along on the same scan instead of a second round-trip.
+        """
+        rows = await self._fetch_prepared(SQL_GET_GUILD_LEADERBOARD_WITH_TOTALS, guild_id, limit)
+
+        # The last three columns are the window totals; the first seven are
+        # exactly UserStats' fields
+        stats = [UserStats(*row[:7]) for row in rows]
+
+        if rows:
+            totals = {
+                'total_completed': rows[0]['total_completed'] or 0,
+                'total_accepted': rows[0]['total_accepted'] or 0,
+                'active_users': rows[0]['active_users'] or 0
+            }
+        else:
+            totals = {'total_completed': 0, 'total_accepted': 0, 'active_users': 0}
+        return stats, totals
+
     async def get_total_guild_stats(self, guild_id: int) -> Dict[str, int]:
         """Get total guild statistics"""
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow('''
-                SELECT 
-                    SUM(quests_completed) as total_completed,
-                    SUM(quests_accepted) as total_accepted,
-                    COUNT(*) as active_users
-                FROM user_stats 
-                WHERE guild_id = $1
-            ''', guild_id)
-            
-            return {
-                'total_completed': row['total_completed'] or 0,
-                'total_accepted': row['total_accepted'] or 0,
-                'active_users': row['active_users'] or 0
-            }
+        row = await self._fetchrow_prepared(SQL_GET_TOTAL_GUILD_STATS, guild_id)
+        return {
+            'total_completed': row['total_completed'] or 0,
+            'total_accepted': row['total_accepted'] or 0,
+            'active_users': row['active_users'] or 0
+        }
     
     async def save_channel_config(self, config: ChannelConfig):
         """Save channel configuration"""
-        async with self.pool.acquire() as conn:
-            await conn.execute('''
-                INSERT INTO channel_config (guild_id, quest_list_channel, quest_accept_channel, 
-                                          quest_submit_channel, quest_approval_channel, notification_channel)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                ON CONFLICT (guild_id) DO UPDATE SET
-                    quest_list_channel = EXCLUDED.quest_list_channel,
-                    quest_accept_channel = EXCLUDED.quest_accept_channel,
-                    quest_submit_channel = EXCLUDED.quest_submit_channel,
-                    quest_approval_channel = EXCLUDED.quest_approval_channel,
-                    notification_channel = EXCLUDED.notification_channel
-            ''', config.guild_id, config.quest_list_channel, config.quest_accept_channel,
-                config.quest_submit_channel, config.quest_approval_channel, config.notification_channel)
+        await self.pool.execute(SQL_SAVE_CHANNEL_CONFIG,
+            config.guild_id, config.quest_list_channel, config.quest_accept_channel,
+            config.quest_submit_channel, config.quest_approval_channel, config.notification_channel)
+        self._channel_cfg_cache.pop(config.guild_id, None)
     
+    async def load_all_channel_configs(self) -> List[ChannelConfig]:
+        """Get all stored channel configurations"""
+        rows = await self._fetch_prepared(SQL_LOAD_ALL_CHANNEL_CONFIGS)
+        return [ChannelConfig(*row) for row in rows]
+
     async def get_channel_config(self, guild_id: int) -> Optional[ChannelConfig]:
-        """Get channel configuration for a guild"""
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow('''
-                SELECT * FROM channel_config WHERE guild_id = $1
-            ''', guild_id)
-            
-            if row:
-                return ChannelConfig(
-                    guild_id=row['guild_id'],
-                    quest_list_channel=row['quest_list_channel'],
-                    quest_accept_channel=row['quest_accept_channel'],
-                    quest_submit_channel=row['quest_submit_channel'],
-                    quest_approval_channel=row['quest_approval_channel'],
-                    notification_channel=row['notification_channel']
-                )
-            return None
+        """Get channel configuration for a guild (read-mostly, so cached)"""
+        cached = self._channel_cfg_cache.get(guild_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        row = await self._fetchrow_prepared(SQL_GET_CHANNEL_CONFIG, guild_id)
+        config = ChannelConfig(*row) if row else None
+        self._channel_cfg_cache[guild_id] = (time.monotonic() + self._CHANNEL_CFG_TTL, config)
+        return config
     
     async def close(self):
         """Close database connection"""
@@ -1,323 +1,774 @@
-import json
 import os
 import asyncio
+from collections import defaultdict
+from dataclasses import MISSING, fields
+
+from sortedcontainers import SortedList
+
+import msgpack
+import orjson
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from bot.models import Quest, QuestProgress, UserStats, ChannelConfig
-import subprocess
+
+try:
+    # C-extension ISO-8601 parser; ~20x faster than datetime.fromisoformat
+    from ciso8601 import parse_datetime as _fromiso
+except ImportError:
+    _fromiso = datetime.fromisoformat
+
+
+def _iso(value) -> Optional[str]:
+    """Serialize a datetime (or pass through an ISO string) for storage"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value or None
+
+
+def _specialize(cls, exclude=()):
+    """Generate to_dict/from_dict functions specialized to one model class
+
+    Compiles one expression per field from dataclasses.fields() at import,
+    so conversions skip the per-call .get/isinstance dispatch a generic
+    helper would pay. datetime fields round-trip through _iso/_fromiso,
+    and *_date string fields are normalized with _iso on the way out
+    because some callers hand in datetimes (see UserStats).
+    """
+    to_parts = []
+    from_parts = []
+    for f in fields(cls):
+        if f.name in exclude:
+            continue
+        if f.type is datetime:
+            to_parts.append(f"'{f.name}': _iso(o.{f.name})")
+            from_parts.append(
+                f"{f.name}=_fromiso(d['{f.name}']) if d.get('{f.name}') else None")
+            continue
+        if f.name.endswith('_date'):
+            to_parts.append(f"'{f.name}': _iso(o.{f.name})")
+        else:
+            to_parts.append(f"'{f.name}': o.{f.name}")
+        if f.default is MISSING:
+            from_parts.append(f"{f.name}=d['{f.name}']")
+        else:
+            from_parts.append(f"{f.name}=d.get('{f.name}', {f.default!r})")
+    source = (f"def _to_dict(o):\n    return {{{', '.join(to_parts)}}}\n"
+              f"def _from_dict(d):\n    return _cls({', '.join(from_parts)})\n")
+    namespace = {'_cls': cls, '_fromiso': _fromiso, '_iso': _iso}
+    exec(source, namespace)
+    return namespace['_to_dict'], namespace['_from_dict']
+
+
+_quest_to_dict, _quest_from_dict = _specialize(Quest)
+_progress_to_dict, _progress_from_dict = _specialize(QuestProgress)
+# The *_ts mirrors are derived from the dates in __post_init__; storing
+# them would let a delta update leave them stale, so recompute on load
+_stats_to_dict, _stats_from_dict = _specialize(
+    UserStats, exclude=('first_quest_ts', 'last_quest_ts'))
+_config_to_dict, _config_from_dict = _specialize(ChannelConfig)
 
 class JSONDatabase:
     """JSON file-based database interface for the quest bot"""
-    
+
+    # Fold the write-ahead logs back into the snapshots after this many appends
+    _COMPACT_EVERY = 256
+
+    # Wait this long after the first unsaved change before committing to git,
+    # so a burst of saves becomes one commit
+    _GIT_DEBOUNCE = 30.0
+
+    # Table attribute names, in snapshot order
+    _TABLES = ('quests', 'quest_progress', 'user_stats', 'channel_config')
+
     def __init__(self):
         self.data_dir = "data"
-        self.quests_file = os.path.join(self.data_dir, "quests.json")
-        self.progress_file = os.path.join(self.data_dir, "quest_progress.json")
-        self.stats_file = os.path.join(self.data_dir, "user_stats.json")
-        self.config_file = os.path.join(self.data_dir, "channel_config.json")
+        # Single combined snapshot plus one write-ahead log. The snapshot
+        # is msgpack: it's bot state, never hand-edited, and the binary
+        # format is both smaller and cheaper to encode than JSON text.
+        self.db_file = os.path.join(self.data_dir, "db.msgpack")
+        self.wal_file = self.db_file + '.log'
+        # Retired log from an in-progress compaction; deleted once the
+        # snapshot that covers it has landed
+        self.wal_old_file = self.wal_file + '.old'
+        # Progress is the highest-churn table; it compacts into one shard
+        # file per guild so a busy guild only rewrites its own records
+        self.progress_dir = os.path.join(self.data_dir, "progress")
         
         # Initialize data structures
         self.quests = {}
         self.quest_progress = {}
         self.user_stats = {}
         self.channel_config = {}
-        
+
+        # Append-only write-ahead log; single-record saves append one line
+        # instead of rewriting the snapshot
+        self._wal: Optional[Any] = None
+        self._wal_appends = 0
+        self._compacting = False
+
+        # Queued WAL lines; one writer task batches them so a burst of
+        # saves costs one write instead of one syscall each
+        self._write_q: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
+        # Set on every mutation; a background task turns it into one
+        # debounced git commit instead of three subprocesses per save
+        self._dirty: Optional[asyncio.Event] = None
+        self._git_task: Optional[asyncio.Task] = None
+
+        # Secondary indexes so guild- and user-scoped queries touch only
+        # their own records instead of scanning every row
+        self._quests_by_guild: Dict[int, set] = defaultdict(set)
+        self._progress_by_user: Dict[int, set] = defaultdict(set)
+        self._progress_by_quest: Dict[str, set] = defaultdict(set)
+        self._progress_by_guild: Dict[int, set] = defaultdict(set)
+        self._stats_by_guild: Dict[int, set] = defaultdict(set)
+
+        # Guilds whose progress shard must be rewritten at next compaction
+        self._dirty_progress_guilds: set = set()
+        self._progress_needs_sharding = False
+
+        # Completed-but-unapproved progress keys bucketed by
+        # (creator_id, guild_id), so the approvals dashboard is a lookup
+        self._pending: Dict[tuple, set] = defaultdict(set)
+
+        # Constructed dataclasses keyed by record key, so repeated reads
+        # skip the dict -> object translation (and its fromisoformat calls)
+        self._quest_objs: Dict[str, Quest] = {}
+        self._progress_objs: Dict[str, QuestProgress] = {}
+        self._stats_objs: Dict[str, UserStats] = {}
+
+        # Per-guild stats records kept permanently sorted, so leaderboard
+        # reads are a slice instead of an O(N log N) sort per command
+        self._leaderboards: Dict[int, SortedList] = defaultdict(self._new_leaderboard)
+
+        # Running guild-wide counters, adjusted on every stats write so
+        # get_total_guild_stats never has to walk the table
+        self._guild_totals: Dict[int, Dict[str, int]] = defaultdict(
+            lambda: {'total_completed': 0, 'total_accepted': 0, 'active_users': 0})
+
+    @staticmethod
+    def _new_leaderboard() -> SortedList:
+        return SortedList(key=lambda d: (-d.get('quests_completed', 0),
+                                         -d.get('quests_accepted', 0)))
+
+    def _legacy_files(self):
+        """(table attribute name, pre-merge snapshot path) pairs"""
+        return [
+            ('quests', os.path.join(self.data_dir, "quests.json")),
+            ('quest_progress', os.path.join(self.data_dir, "quest_progress.json")),
+            ('user_stats', os.path.join(self.data_dir, "user_stats.json")),
+            ('channel_config', os.path.join(self.data_dir, "channel_config.json")),
+        ]
+
     async def initialize(self):
         """Initialize the database and load existing data"""
         os.makedirs(self.data_dir, exist_ok=True)
+        os.makedirs(self.progress_dir, exist_ok=True)
         await self._load_data()
-        
+        replayed = await asyncio.to_thread(self._replay_wal)
+        self._build_indexes()
+        if self._progress_needs_sharding:
+            # Progress came from a pre-shard snapshot; write every guild's
+            # shard at the next compaction
+            self._dirty_progress_guilds.update(self._progress_by_guild)
+            self._progress_needs_sharding = False
+        self._open_wal()
+        self._write_q = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer())
+        self._dirty = asyncio.Event()
+        self._git_task = asyncio.create_task(self._git_worker())
+        if replayed:
+            # Fold entries left over from the last run into the snapshots
+            # so every run starts with empty logs
+            await self._compact()
+
     async def _load_data(self):
         """Load data from JSON files"""
-        for file_path, data_attr in [
-            (self.quests_file, 'quests'),
-            (self.progress_file, 'quest_progress'),
-            (self.stats_file, 'user_stats'),
-            (self.config_file, 'channel_config')
-        ]:
+        # Reads are blocking; keep the event loop free while loading
+        await asyncio.to_thread(self._load_files_sync)
+
+    def _load_files_sync(self):
+        """Read the snapshot from disk (blocking; call via to_thread)
+
+        The snapshot is written atomically, so a parse failure means real
+        corruption; let it raise rather than silently starting empty.
+        """
+        if os.path.exists(self.db_file):
+            # Stream-decode straight off the file so a large snapshot never
+            # sits in memory twice (raw bytes plus decoded dicts)
+            with open(self.db_file, 'rb') as f:
+                blob = next(msgpack.Unpacker(f, raw=False), {})
+            for data_attr in self._TABLES:
+                setattr(self, data_attr, blob.get(data_attr, {}))
+            if not self._load_progress_shards():
+                if not self.quest_progress:
+                    # No shards and nothing embedded: a crash mid-migration
+                    # may have left progress only in the legacy files
+                    self._load_legacy_progress()
+                # Progress still outside the shards (pre-shard format)
+                self._progress_needs_sharding = bool(self.quest_progress)
+            return
+        # One-time migration from the JSON-era combined snapshot
+        json_db = os.path.join(self.data_dir, "db.json")
+        if os.path.exists(json_db):
+            with open(json_db, 'rb') as f:
+                blob = orjson.loads(f.read())
+            for data_attr in self._TABLES:
+                setattr(self, data_attr, blob.get(data_attr, {}))
+            self._progress_needs_sharding = bool(self.quest_progress)
+            return
+        # ...or from the original per-table files
+        for data_attr, file_path in self._legacy_files():
             if os.path.exists(file_path):
-                try:
-                    with open(file_path, 'r') as f:
-                        setattr(self, data_attr, json.load(f))
-                except (json.JSONDecodeError, FileNotFoundError):
-                    setattr(self, data_attr, {})
+                with open(file_path, 'rb') as f:
+                    setattr(self, data_attr, orjson.loads(f.read()))
             else:
                 setattr(self, data_attr, {})
+        self._progress_needs_sharding = bool(self.quest_progress)
+
+    def _load_legacy_progress(self):
+        """Recover quest_progress from the pre-shard files, if any"""
+        legacy = os.path.join(self.data_dir, "quest_progress.json")
+        if os.path.exists(legacy):
+            with open(legacy, 'rb') as f:
+                self.quest_progress = orjson.loads(f.read())
+            return
+        json_db = os.path.join(self.data_dir, "db.json")
+        if os.path.exists(json_db):
+            with open(json_db, 'rb') as f:
+                self.quest_progress = orjson.loads(f.read()).get('quest_progress', {})
+
+    def _load_progress_shards(self) -> bool:
+        """Merge the per-guild progress shards into the flat table"""
+        if not os.path.isdir(self.progress_dir):
+            return False
+        found = False
+        for name in os.listdir(self.progress_dir):
+            if not name.endswith('.msgpack'):
+                continue
+            with open(os.path.join(self.progress_dir, name), 'rb') as f:
+                self.quest_progress.update(next(msgpack.Unpacker(f, raw=False), {}))
+            found = True
+        return found
     
+    def _replay_wal(self) -> int:
+        """Apply log entries left over from the last run; returns count
+
+        A crash mid-compaction can leave a retired log behind; it holds
+        the older entries, so it replays before the active log.
+        """
+        replayed = 0
+        for log_path in (self.wal_old_file, self.wal_file):
+            if not os.path.exists(log_path):
+                continue
+            with open(log_path, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # Torn tail write from a crash; everything before
+                        # it is intact, so stop here
+                        break
+                    data = getattr(self, record['table'])
+                    if record['table'] == 'quest_progress':
+                        touched = record.get('val') or data.get(record['key'])
+                        if touched:
+                            self._dirty_progress_guilds.add(touched['guild_id'])
+                    if record['op'] == 'put':
+                        data[record['key']] = record['val']
+                    else:
+                        data.pop(record['key'], None)
+                    replayed += 1
+        return replayed
+
+    def _build_indexes(self):
+        """Rebuild the secondary indexes from the loaded tables"""
+        self._quests_by_guild.clear()
+        self._progress_by_user.clear()
+        self._progress_by_quest.clear()
+        self._progress_by_guild.clear()
+        self._stats_by_guild.clear()
+        self._pending.clear()
+        self._quest_objs.clear()
+        self._progress_objs.clear()
+        self._stats_objs.clear()
+        self._leaderboards.clear()
+        self._guild_totals.clear()
+        for quest_id, data in self.quests.items():
+            self._quests_by_guild[data['guild_id']].add(quest_id)
+        for key, data in self.quest_progress.items():
+            self._progress_by_user[data['user_id']].add(key)
+            self._progress_by_quest[data['quest_id']].add(key)
+            self._progress_by_guild[data['guild_id']].add(key)
+            self._update_pending(key, data)
+        for key, data in self.user_stats.items():
+            self._stats_by_guild[data['guild_id']].add(key)
+            self._leaderboards[data['guild_id']].add(data)
+            totals = self._guild_totals[data['guild_id']]
+            totals['total_completed'] += data.get('quests_completed', 0)
+            totals['total_accepted'] += data.get('quests_accepted', 0)
+            totals['active_users'] += 1
+
+    def _open_wal(self):
+        """Open the unbuffered append-only log"""
+        self._wal = open(self.wal_file, 'ab', buffering=0)
+
+    def _wal_append(self, table: str, key: str, value: Optional[dict]):
+        """Log one mutation: O(record) written instead of O(database)"""
+        if value is not None:
+            record = {'table': table, 'op': 'put', 'key': key, 'val': value}
+        else:
+            record = {'table': table, 'op': 'del', 'key': key}
+        line = orjson.dumps(record) + b'\n'
+        if self._write_q is not None:
+            # The writer task is the only thing that writes the log fd;
+            # a second path would let lines land out of mutation order
+            self._write_q.put_nowait(line)
+        else:
+            self._wal.write(line)
+        self._wal_appends += 1
+        if self._dirty is not None:
+            self._dirty.set()
+        if self._wal_appends >= self._COMPACT_EVERY and not self._compacting:
+            asyncio.get_running_loop().create_task(self._compact())
+
+    async def _writer(self):
+        """Drain queued WAL lines, coalescing bursts into single writes"""
+        while True:
+            lines = [await self._write_q.get()]
+            while not self._write_q.empty() and len(lines) < 256:
+                lines.append(self._write_q.get_nowait())
+            await asyncio.to_thread(self._wal.write, b''.join(lines))
+            for _ in lines:
+                self._write_q.task_done()
+
+    async def _rotate_wal(self):
+        """Retire the active log and open a fresh one in its place"""
+        if self._write_q is not None:
+            # Wait out any in-flight writer batch so the old fd is idle;
+            # no awaits after this, so the swap is atomic on the loop
+            await self._write_q.join()
+        self._wal.close()
+        os.replace(self.wal_file, self.wal_old_file)
+        self._open_wal()
+
+    async def _compact(self):
+        """Fold the logs into fresh snapshots and retire the old log
+
+        The log rotates *before* the snapshot is packed: saves landing
+        during the file write append to the fresh log, so deleting the
+        retired one can never drop an acknowledged write the snapshot
+        doesn't already cover. Until the delete, replay applies the
+        retired log first and stays correct either way.
+        """
+        if self._compacting:
+            return
+        self._compacting = True
+        try:
+            await self._rotate_wal()
+            await self._save_data()
+            if os.path.exists(self.wal_old_file):
+                os.remove(self.wal_old_file)
+            self._wal_appends = 0
+        finally:
+            self._compacting = False
+
     async def _save_data(self):
-        """Save all data to JSON files and commit to git"""
-        data_files = [
-            (self.quests_file, self.quests),
-            (self.progress_file, self.quest_progress),
-            (self.stats_file, self.user_stats),
-            (self.config_file, self.channel_config)
-        ]
-        
-        for file_path, data in data_files:
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
-        
-        await self._git_commit()
-    
-    async def _git_commit(self):
-        """Automatically commit changes to git"""
+        """Write full snapshots to disk"""
+        # Pack on the event loop so the worker thread never iterates the
+        # live tables while concurrent commands mutate them (packb over a
+        # changing dict raises); only the blocking file writes go off-loop
+        blob = msgpack.packb(
+            {data_attr: getattr(self, data_attr) for data_attr in self._TABLES
+             if data_attr != 'quest_progress'},
+            use_bin_type=True, default=str)
+        # Pack only the progress shards whose guilds changed; clear the
+        # dirty set first so marks landing mid-write survive for next time
+        dirty = list(self._dirty_progress_guilds)
+        self._dirty_progress_guilds.clear()
+        shards = []
+        for guild_id in dirty:
+            keys = self._progress_by_guild.get(guild_id)
+            if keys:
+                packed = msgpack.packb({key: self.quest_progress[key] for key in keys},
+                                       use_bin_type=True, default=str)
+            else:
+                packed = None
+            shards.append((guild_id, packed))
+        await asyncio.to_thread(self._write_files_sync, blob, shards)
+        if self._dirty is not None:
+            self._dirty.set()
+
+    def _write_files_sync(self, blob: bytes, shards):
+        """Write packed snapshots to disk (blocking; call via to_thread)
+
+        Each blob is written to a temp sibling, fsynced, and renamed into
+        place so a crash mid-write can never leave a torn snapshot.
+        """
+        # Shards land before the main snapshot is swapped in: the loader
+        # treats db.msgpack as authoritative, so a crash in between must
+        # never leave a new snapshot with the progress shards missing
+        for guild_id, packed in shards:
+            shard_path = os.path.join(self.progress_dir, f"{guild_id}.msgpack")
+            if packed is None:
+                if os.path.exists(shard_path):
+                    os.remove(shard_path)
+                continue
+            shard_tmp = shard_path + '.tmp'
+            with open(shard_tmp, 'wb') as f:
+                f.write(packed)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(shard_tmp, shard_path)
+        tmp_path = self.db_file + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.db_file)
+        # Drop migrated JSON-era files so they can't shadow the snapshot
+        stale = [path for _, path in self._legacy_files()]
+        stale.append(os.path.join(self.data_dir, "db.json"))
+        for file_path in stale:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        # Persist the renames themselves
+        dir_fd = os.open(self.data_dir, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    async def _git_worker(self):
+        """Coalesce bursts of saves into one debounced git commit"""
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(self._GIT_DEBOUNCE)
+            self._dirty.clear()
+            await self._do_git()
+
+    async def _do_git(self):
+        """Commit the data directory to git without blocking the event loop"""
         try:
-            subprocess.run(['git', 'add', 'data/'], check=False, capture_output=True)
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             commit_msg = f"Auto-update bot data - {timestamp}"
-            subprocess.run(['git', 'commit', '-m', commit_msg], check=False, capture_output=True)
-            subprocess.run(['git', 'push'], check=False, capture_output=True)
+            for args in (['add', 'data/'],
+                         ['commit', '-m', commit_msg],
+                         ['push']):
+                proc = await asyncio.create_subprocess_exec(
+                    'git', *args,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL)
+                await proc.wait()
         except Exception as e:
             print(f"Git commit failed: {e}")
     
     async def save_quest(self, quest: Quest):
         """Save a quest to the database"""
-        quest_data = {
-            'quest_id': quest.quest_id,
-            'title': quest.title,
-            'description': quest.description,
-            'creator_id': quest.creator_id,
-            'guild_id': quest.guild_id,
-            'requirements': quest.requirements,
-            'reward': quest.reward,
-            'rank': quest.rank,
-            'category': quest.category,
-            'status': quest.status,
-            'created_at': quest.created_at.isoformat() if quest.created_at else datetime.now().isoformat(),
-            'required_role_ids': quest.required_role_ids
-        }
-        
+        quest_data = _quest_to_dict(quest)
         self.quests[quest.quest_id] = quest_data
-        await self._save_data()
+        self._quest_objs[quest.quest_id] = quest
+        self._quests_by_guild[quest.guild_id].add(quest.quest_id)
+        self._wal_append('quests', quest.quest_id, quest_data)
     
+    def _quest_obj(self, quest_id: str, data: dict) -> Quest:
+        """Get the cached Quest for a raw record, building it at most once"""
+        quest = self._quest_objs.get(quest_id)
+        if quest is None:
+            quest = self._quest_objs[quest_id] = _quest_from_dict(data)
+        return quest
+
+    def _progress_obj(self, key: str, data: dict) -> QuestProgress:
+        """Get the cached QuestProgress for a raw record"""
+        progress = self._progress_objs.get(key)
+        if progress is None:
+            progress = self._progress_objs[key] = _progress_from_dict(data)
+        return progress
+
+    def _stats_obj(self, key: str, data: dict) -> UserStats:
+        """Get the cached UserStats for a raw record"""
+        stats = self._stats_objs.get(key)
+        if stats is None:
+            stats = self._stats_objs[key] = _stats_from_dict(data)
+        return stats
+
     async def get_quest(self, quest_id: str) -> Optional[Quest]:
         """Get a quest by ID"""
-        if quest_id in self.quests:
-            data = self.quests[quest_id]
-            return Quest(
-                quest_id=data['quest_id'],
-                title=data['title'],
-                description=data['description'],
-                creator_id=data['creator_id'],
-                guild_id=data['guild_id'],
-                requirements=data.get('requirements', ''),
-                reward=data.get('reward', ''),
-                rank=data.get('rank', 'normal'),
-                category=data.get('category', 'other'),
-                status=data.get('status', 'available'),
-                created_at=datetime.fromisoformat(data['created_at']) if data.get('created_at') else None,
-                required_role_ids=data.get('required_role_ids', [])
-            )
+        data = self.quests.get(quest_id)
+        if data is not None:
+            return self._quest_obj(quest_id, data)
         return None
 
+    async def get_quests_by_ids(self, quest_ids: List[str]) -> Dict[str, Quest]:
+        """Get multiple quests by ID in one pass"""
+        quests = {}
+        for quest_id in quest_ids:
+            quest = await self.get_quest(quest_id)
+            if quest:
+                quests[quest_id] = quest
+        return quests
+
     async def get_guild_quests(self, guild_id: int, status: str = None) -> List[Quest]:
         """Get all quests for a guild, optionally filtered by status"""
         quests = []
-        for quest_data in self.quests.values():
-            if quest_data['guild_id'] == guild_id:
-                if status is None or quest_data.get('status') == status:
-                    quest = Quest(
-                        quest_id=quest_data['quest_id'],
-                        title=quest_data['title'],
-                        description=quest_data['description'],
-                        creator_id=quest_data['creator_id'],
-                        guild_id=quest_data['guild_id'],
-                        requirements=quest_data.get('requirements', ''),
-                        reward=quest_data.get('reward', ''),
-                        rank=quest_data.get('rank', 'normal'),
-                        category=quest_data.get('category', 'other'),
-                        status=quest_data.get('status', 'available'),
-                        created_at=datetime.fromisoformat(quest_data['created_at']) if quest_data.get('created_at') else None,
-                        required_role_ids=quest_data.get('required_role_ids', [])
-                    )
-                    quests.append(quest)
+        for quest_id in self._quests_by_guild.get(guild_id, ()):
+            quest_data = self.quests[quest_id]
+            if status is None or quest_data.get('status') == status:
+                quests.append(self._quest_obj(quest_id, quest_data))
         return quests
     
+    async def iter_guild_quests(self, guild_id: int, status: str = None):
+        """Stream a guild's quests; data is in memory, so this just yields"""
+        for quest in await self.get_guild_quests(guild_id, status):
+            yield quest
+
+    # Display order of quest ranks, matching the SQL CASE used by Database
+    _RANK_ORDER = {'easy': 0, 'normal': 1, 'medium': 2, 'hard': 3, 'impossible': 4}
+
+    async def get_available_quests(self, guild_id: int, rank: str = None, category: str = None) -> List[Quest]:
+        """Get available quests for a guild, filtered and sorted in one pass"""
+        quests = [q for q in await self.get_guild_quests(guild_id, 'available')
+                  if (rank is None or q.rank == rank)
+                  and (category is None or q.category == category)]
+        quests.sort(key=lambda q: (self._RANK_ORDER.get(q.rank, 1), q.created_at))
+        return quests
+
     async def delete_quest(self, quest_id: str):
         """Delete a quest"""
         if quest_id in self.quests:
+            quest_data = self.quests[quest_id]
+            guild_id = quest_data['guild_id']
+            creator_id = quest_data['creator_id']
             del self.quests[quest_id]
-            to_remove = []
-            for key, progress in self.quest_progress.items():
-                if progress.get('quest_id') == quest_id:
-                    to_remove.append(key)
-            for key in to_remove:
-                del self.quest_progress[key]
-            await self._save_data()
+            self._quest_objs.pop(quest_id, None)
+            self._quests_by_guild[guild_id].discard(quest_id)
+            self._wal_append('quests', quest_id, None)
+            for key in self._progress_by_quest.pop(quest_id, ()):
+                data = self.quest_progress.pop(key, None)
+                if data is None:
+                    continue
+                self._progress_objs.pop(key, None)
+                self._progress_by_user[data['user_id']].discard(key)
+                self._progress_by_guild[data['guild_id']].discard(key)
+                self._pending[(creator_id, data['guild_id'])].discard(key)
+                self._dirty_progress_guilds.add(data['guild_id'])
+                self._wal_append('quest_progress', key, None)
     
+    def _update_pending(self, key: str, data: dict):
+        """Track a progress record's membership in the approval queue"""
+        quest_data = self.quests.get(data['quest_id'])
+        if quest_data is None:
+            return
+        bucket = (quest_data['creator_id'], data['guild_id'])
+        if data.get('status') == 'completed':
+            self._pending[bucket].add(key)
+        else:
+            self._pending[bucket].discard(key)
+
+    def _put_progress(self, progress: QuestProgress):
+        """Store a progress record in the in-memory dict; returns (key, data)"""
+        key = f"{progress.user_id}_{progress.quest_id}"
+        self._progress_objs[key] = progress
+        self._progress_by_user[progress.user_id].add(key)
+        self._progress_by_quest[progress.quest_id].add(key)
+        self._progress_by_guild[progress.guild_id].add(key)
+        self._dirty_progress_guilds.add(progress.guild_id)
+        data = self.quest_progress[key] = _progress_to_dict(progress)
+        self._update_pending(key, data)
+        return key, data
+
     async def save_quest_progress(self, progress: QuestProgress):
         """Save quest progress to the database"""
-        key = f"{progress.user_id}_{progress.quest_id}"
-        progress_data = {
-            'quest_id': progress.quest_id,
-            'user_id': progress.user_id,
-            'guild_id': progress.guild_id,
-            'status': progress.status,
-            'accepted_at': progress.accepted_at.isoformat() if progress.accepted_at else None,
-            'completed_at': progress.completed_at.isoformat() if progress.completed_at else None,
-            'proof_text': progress.proof_text,
-            'proof_image_urls': progress.proof_image_urls,
-            'approval_status': progress.approval_status,
-            'accepted_channel_id': progress.accepted_channel_id
-        }
-        
-        self.quest_progress[key] = progress_data
-        await self._save_data()
-    
+        key, data = self._put_progress(progress)
+        self._wal_append('quest_progress', key, data)
+
+    async def save_progress_with_stats(self, progress: QuestProgress, completed_delta: int = 0,
+                                       accepted_delta: int = 0, rejected_delta: int = 0):
+        """Persist progress and apply stat deltas together"""
+        key, data = self._put_progress(progress)
+        self._wal_append('quest_progress', key, data)
+        stats_key, stats_data = self._apply_stats_delta(
+            progress.user_id, progress.guild_id,
+            completed_delta, accepted_delta, rejected_delta)
+        self._wal_append('user_stats', stats_key, stats_data)
+
+    async def patch_quest_progress(self, user_id: int, quest_id: str, **fields):
+        """Update fields on a stored progress record in place
+
+        Skips the dataclass -> dict re-encode that save_quest_progress does;
+        read-modify-write flows only pay for the fields they changed.
+        """
+        key = f"{user_id}_{quest_id}"
+        data = self.quest_progress.get(key)
+        if data is None:
+            return
+        data.update({k: (v.isoformat() if isinstance(v, datetime) else v)
+                     for k, v in fields.items()})
+        # The raw record changed underneath any cached instance
+        self._progress_objs.pop(key, None)
+        self._dirty_progress_guilds.add(data['guild_id'])
+        self._update_pending(key, data)
+        self._wal_append('quest_progress', key, data)
+
     async def get_user_quest_progress(self, user_id: int, quest_id: str) -> Optional[QuestProgress]:
         """Get most recent progress for a specific user and quest"""
         key = f"{user_id}_{quest_id}"
-        if key in self.quest_progress:
-            data = self.quest_progress[key]
-            return QuestProgress(
-                quest_id=data['quest_id'],
-                user_id=data['user_id'],
-                guild_id=data['guild_id'],
-                status=data['status'],
-                accepted_at=datetime.fromisoformat(data['accepted_at']) if data.get('accepted_at') else None,
-                completed_at=datetime.fromisoformat(data['completed_at']) if data.get('completed_at') else None,
-                proof_text=data.get('proof_text', ''),
-                proof_image_urls=data.get('proof_image_urls', []),
-                approval_status=data.get('approval_status', ''),
-                accepted_channel_id=data.get('accepted_channel_id')
-            )
+        data = self.quest_progress.get(key)
+        if data is not None:
+            return self._progress_obj(key, data)
         return None
     
     async def get_user_quests(self, user_id: int, guild_id: int = None) -> List[QuestProgress]:
         """Get all quests for a user"""
         progresses = []
-        for data in self.quest_progress.values():
-            if data['user_id'] == user_id:
-                if guild_id is None or data['guild_id'] == guild_id:
-                    progress = QuestProgress(
-                        quest_id=data['quest_id'],
-                        user_id=data['user_id'],
-                        guild_id=data['guild_id'],
-                        status=data['status'],
-                        accepted_at=datetime.fromisoformat(data['accepted_at']) if data.get('accepted_at') else None,
-                        completed_at=datetime.fromisoformat(data['completed_at']) if data.get('completed_at') else None,
-                        proof_text=data.get('proof_text', ''),
-                        proof_image_urls=data.get('proof_image_urls', []),
-                        approval_status=data.get('approval_status', ''),
-                        accepted_channel_id=data.get('accepted_channel_id')
-                    )
-                    progresses.append(progress)
+        for key in self._progress_by_user.get(user_id, ()):
+            data = self.quest_progress[key]
+            if guild_id is None or data['guild_id'] == guild_id:
+                progresses.append(self._progress_obj(key, data))
         return sorted(progresses, key=lambda x: x.accepted_at or datetime.min, reverse=True)
 
     async def get_pending_approvals(self, creator_id: int, guild_id: int) -> List[tuple]:
-        """Get quests pending approval for a quest creator"""
+        """Get (progress, quest) pairs pending approval for a quest creator"""
         pending = []
-        for progress_data in self.quest_progress.values():
-            if progress_data['guild_id'] == guild_id and progress_data['status'] == 'completed':
-                quest_id = progress_data['quest_id']
-                if quest_id in self.quests and self.quests[quest_id]['creator_id'] == creator_id:
-                    quest_title = self.quests[quest_id]['title']
-                    pending.append((
-                        quest_id,
-                        progress_data['user_id'],
-                        progress_data.get('proof_text', ''),
-                        progress_data.get('proof_image_urls', []),
-                        quest_title
-                    ))
+        for key in self._pending.get((creator_id, guild_id), ()):
+            progress_data = self.quest_progress[key]
+            quest_id = progress_data['quest_id']
+            pending.append((self._progress_obj(key, progress_data),
+                            self._quest_obj(quest_id, self.quests[quest_id])))
         return pending
     
     async def save_user_stats(self, stats: UserStats):
         """Save user statistics"""
         key = f"{stats.user_id}_{stats.guild_id}"
-        stats_data = {
-            'user_id': stats.user_id,
-            'guild_id': stats.guild_id,
-            'quests_completed': stats.quests_completed,
-            'quests_accepted': stats.quests_accepted,
-            'quests_rejected': stats.quests_rejected,
-            'first_quest_date': stats.first_quest_date.isoformat() if stats.first_quest_date else None,
-            'last_quest_date': stats.last_quest_date.isoformat() if stats.last_quest_date else None
-        }
-        
+        old_data = self.user_stats.get(key)
+        totals = self._guild_totals[stats.guild_id]
+        if old_data is not None:
+            self._leaderboards[stats.guild_id].remove(old_data)
+            totals['total_completed'] -= old_data.get('quests_completed', 0)
+            totals['total_accepted'] -= old_data.get('quests_accepted', 0)
+        else:
+            totals['active_users'] += 1
+        totals['total_completed'] += stats.quests_completed
+        totals['total_accepted'] += stats.quests_accepted
+        stats_data = _stats_to_dict(stats)
         self.user_stats[key] = stats_data
-        await self._save_data()
+        self._leaderboards[stats.guild_id].add(stats_data)
+        self._stats_objs[key] = stats
+        self._stats_by_guild[stats.guild_id].add(key)
+        self._wal_append('user_stats', key, stats_data)
     
+    def _apply_stats_delta(self, user_id: int, guild_id: int,
+                           completed_delta: int = 0, accepted_delta: int = 0,
+                           rejected_delta: int = 0):
+        """Apply stat deltas in place, creating the record if needed"""
+        key = f"{user_id}_{guild_id}"
+        data = self.user_stats.get(key)
+        now_iso = datetime.now().isoformat()
+        if data is not None:
+            # Pull the record out before its sort key changes underneath
+            # the sorted leaderboard
+            self._leaderboards[guild_id].remove(data)
+        if data is None:
+            data = {
+                'user_id': user_id,
+                'guild_id': guild_id,
+                'quests_completed': 0,
+                'quests_accepted': 0,
+                'quests_rejected': 0,
+                'first_quest_date': now_iso,
+                'last_quest_date': now_iso
+            }
+            self.user_stats[key] = data
+            self._stats_by_guild[guild_id].add(key)
+            self._guild_totals[guild_id]['active_users'] += 1
+        data['quests_completed'] = data.get('quests_completed', 0) + completed_delta
+        data['quests_accepted'] = data.get('quests_accepted', 0) + accepted_delta
+        data['quests_rejected'] = data.get('quests_rejected', 0) + rejected_delta
+        data['last_quest_date'] = now_iso
+        self._leaderboards[guild_id].add(data)
+        totals = self._guild_totals[guild_id]
+        totals['total_completed'] += completed_delta
+        totals['total_accepted'] += accepted_delta
+        # The raw record changed underneath any cached instance
+        self._stats_objs.pop(key, None)
+        return key, data
+
+    async def increment_user_stats(self, user_id: int, guild_id: int,
+                                   completed_delta: int = 0, accepted_delta: int = 0,
+                                   rejected_delta: int = 0):
+        """Apply stat deltas and log them"""
+        key, data = self._apply_stats_delta(user_id, guild_id,
+                                            completed_delta, accepted_delta, rejected_delta)
+        self._wal_append('user_stats', key, data)
+
     async def get_user_stats(self, user_id: int, guild_id: int) -> Optional[UserStats]:
         """Get user statistics"""
         key = f"{user_id}_{guild_id}"
-        if key in self.user_stats:
-            data = self.user_stats[key]
-            return UserStats(
-                user_id=data['user_id'],
-                guild_id=data['guild_id'],
-                quests_completed=data.get('quests_completed', 0),
-                quests_accepted=data.get('quests_accepted', 0),
-                quests_rejected=data.get('quests_rejected', 0),
-                first_quest_date=datetime.fromisoformat(data['first_quest_date']) if data.get('first_quest_date') else None,
-                last_quest_date=datetime.fromisoformat(data['last_quest_date']) if data.get('last_quest_date') else None
-            )
+        data = self.user_stats.get(key)
+        if data is not None:
+            return self._stats_obj(key, data)
         return None
 
     async def get_guild_leaderboard(self, guild_id: int, limit: int = 10) -> List[UserStats]:
         """Get guild leaderboard"""
-        stats = []
-        for data in self.user_stats.values():
-            if data['guild_id'] == guild_id:
-                stat = UserStats(
-                    user_id=data['user_id'],
-                    guild_id=data['guild_id'],
-                    quests_completed=data.get('quests_completed', 0),
-                    quests_accepted=data.get('quests_accepted', 0),
-                    quests_rejected=data.get('quests_rejected', 0),
-                    first_quest_date=datetime.fromisoformat(data['first_quest_date']) if data.get('first_quest_date') else None,
-                    last_quest_date=datetime.fromisoformat(data['last_quest_date']) if data.get('last_quest_date') else None
-                )
-                stats.append(stat)
-        
-        stats.sort(key=lambda x: (x.quests_completed, x.quests_accepted), reverse=True)
-        return stats[:limit]
+        board = self._leaderboards.get(guild_id)
+        if not board:
+            return []
+        return [self._stats_obj(f"{data['user_id']}_{data['guild_id']}", data)
+                for data in board[:limit]]
     
+    async def get_guild_leaderboard_with_totals(self, guild_id: int, limit: int = 10):
+        """Get the top-N leaderboard plus guild-wide totals in one pass"""
+        totals = await self.get_total_guild_stats(guild_id)
+        return await self.get_guild_leaderboard(guild_id, limit), totals
+
     async def get_total_guild_stats(self, guild_id: int) -> Dict[str, int]:
         """Get total guild statistics"""
-        total_completed = 0
-        total_accepted = 0
-        active_users = 0
-        
-        for data in self.user_stats.values():
-            if data['guild_id'] == guild_id:
-                total_completed += data.get('quests_completed', 0)
-                total_accepted += data.get('quests_accepted', 0)
-                active_users += 1
-        
-        return {
-            'total_completed': total_completed,
-            'total_accepted': total_accepted,
-            'active_users': active_users
-        }
+        totals = self._guild_totals.get(guild_id)
+        if totals is None:
+            return {'total_completed': 0, 'total_accepted': 0, 'active_users': 0}
+        return dict(totals)
     
     async def save_channel_config(self, config: ChannelConfig):
         """Save channel configuration"""
-        config_data = {
-            'guild_id': config.guild_id,
-            'quest_list_channel': config.quest_list_channel,
-            'quest_accept_channel': config.quest_accept_channel,
-            'quest_submit_channel': config.quest_submit_channel,
-            'quest_approval_channel': config.quest_approval_channel,
-            'notification_channel': config.notification_channel
-        }
-        
+        config_data = _config_to_dict(config)
         self.channel_config[str(config.guild_id)] = config_data
-        await self._save_data()
+        self._wal_append('channel_config', str(config.guild_id), config_data)
     
+    async def load_all_channel_configs(self) -> List[ChannelConfig]:
+        """Get all stored channel configurations"""
+        configs = []
+        for guild_id in list(self.channel_config):
+            config = await self.get_channel_config(int(guild_id))
+            if config:
+                configs.append(config)
+        return configs
+
     async def get_channel_config(self, guild_id: int) -> Optional[ChannelConfig]:
         """Get channel configuration for a guild"""
         if str(guild_id) in self.channel_config:
-            data = self.channel_config[str(guild_id)]
-            return ChannelConfig(
-                guild_id=data['guild_id'],
-                quest_list_channel=data.get('quest_list_channel'),
-                quest_accept_channel=data.get('quest_accept_channel'),
-                quest_submit_channel=data.get('quest_submit_channel'),
-                quest_approval_channel=data.get('quest_approval_channel'),
-                notification_channel=data.get('notification_channel')
-            )
+            return _config_from_dict(self.channel_config[str(guild_id)])
         return None
     
     async def close(self):
-        """Close database connection (no-op for JSON)"""
-        pass
+        """Flush the logs into snapshots, commit, and close"""
+        if self._git_task is not None:
+            self._git_task.cancel()
+            self._git_task = None
+        if self._writer_task is not None:
+            # Let queued log lines land before the final compaction
+            await self._write_q.join()
+            self._writer_task.cancel()
+            self._writer_task = None
+            self._write_q = None
+        if self._wal is not None:
+            await self._compact()
+            self._wal.close()
+            self._wal = None
+        if self._dirty is not None and self._dirty.is_set():
+            self._dirty.clear()
+            await self._do_git()
@@ -38,7 +38,7 @@ class QuestStatus:
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class Quest:
     """Quest data model"""
     quest_id: str
@@ -61,7 +61,7 @@ class Quest:
             self.created_at = datetime.now()
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestProgress:
     """Quest progress data model"""
     quest_id: str
@@ -82,7 +82,7 @@ class QuestProgress:
             self.accepted_at = datetime.now()
 
 
-@dataclass
+@dataclass(slots=True)
 class UserStats:
     """User statistics data model"""
     user_id: int
@@ -92,15 +92,32 @@ class UserStats:
     quests_rejected: int = 0
     first_quest_date: str = ""
     last_quest_date: str = ""
-    
+    # Epoch seconds mirroring the dates so render paths skip ISO parsing
+    first_quest_ts: int = 0
+    last_quest_ts: int = 0
+
     def __post_init__(self):
         if not self.first_quest_date:
             self.first_quest_date = datetime.now().isoformat()
         if not self.last_quest_date:
             self.last_quest_date = datetime.now().isoformat()
+        if not self.first_quest_ts:
+            self.first_quest_ts = _to_epoch(self.first_quest_date)
+        if not self.last_quest_ts:
+            self.last_quest_ts = _to_epoch(self.last_quest_date)
+
+
+def _to_epoch(value) -> int:
+    """Convert a datetime or ISO string to integer epoch seconds"""
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    try:
+        return int(datetime.fromisoformat(value).timestamp())
+    except (ValueError, TypeError):
+        return 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelConfig:
     """Channel configuration data model"""
     guild_id: int
@@ -1,30 +1,50 @@
+import time
 import discord
-from typing import List
+from typing import Iterable, List
+
+# Cached quest-creation permission results keyed by
+# (user_id, guild_id, role-set fingerprint); entries expire after the TTL
+_PERM_CACHE_TTL = 60.0
+_PERM_CACHE_MAX = 1024
+_perm_cache = {}
+
+# Role names that grant quest creation (you can customize these)
+_QUEST_CREATOR_ROLES = frozenset({'Quest Master', 'Moderator', 'Admin', 'Staff'})
+
+# Permission bits checked as a single integer AND instead of one
+# attribute access per flag
+_CREATE_PERMS_MASK = discord.Permissions(
+    administrator=True, manage_guild=True, manage_channels=True).value
+_MANAGE_PERMS_MASK = discord.Permissions(
+    administrator=True, manage_guild=True).value
 
 
 def has_quest_creation_permission(user: discord.Member, guild: discord.Guild) -> bool:
-    """Check if user has permission to create quests"""
+    """Check if user has permission to create quests (cached per role set)"""
+    key = (user.id, guild.id, hash(tuple(role.id for role in user.roles)))
+    now = time.monotonic()
+    cached = _perm_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    allowed = _compute_quest_creation_permission(user, guild)
+    if len(_perm_cache) >= _PERM_CACHE_MAX:
+        _perm_cache.clear()
+    _perm_cache[key] = (now + _PERM_CACHE_TTL, allowed)
+    return allowed
+
+
+def _compute_quest_creation_permission(user: discord.Member, guild: discord.Guild) -> bool:
+    """Uncached quest-creation permission check"""
     # Server owner can always create quests
     if user.id == guild.owner_id:
         return True
     
-    # Check for administrator permission
-    if user.guild_permissions.administrator:
-        return True
-    
-    # Check for manage_guild permission
-    if user.guild_permissions.manage_guild:
+    # Administrator, manage_guild, or manage_channels all qualify
+    if user.guild_permissions.value & _CREATE_PERMS_MASK:
         return True
     
-    # Check for manage_channels permission
-    if user.guild_permissions.manage_channels:
-        return True
-    
-    # Check for specific roles (you can customize these role names)
-    quest_creator_roles = ['Quest Master', 'Moderator', 'Admin', 'Staff']
-    user_roles = [role.name for role in user.roles]
-    
-    return any(role in quest_creator_roles for role in user_roles)
+    return not _QUEST_CREATOR_ROLES.isdisjoint(role.name for role in user.roles)
 
 
 def can_manage_quest(user: discord.Member, guild: discord.Guild, quest_creator_id: int) -> bool:
@@ -37,15 +57,8 @@ def can_manage_quest(user: discord.Member, guild: discord.Guild, quest_creator_i
     if user.id == quest_creator_id:
         return True
     
-    # Check for administrator permission
-    if user.guild_permissions.administrator:
-        return True
-    
-    # Check for manage_guild permission
-    if user.guild_permissions.manage_guild:
-        return True
-    
-    return False
+    # Administrator or manage_guild qualifies
+    return bool(user.guild_permissions.value & _MANAGE_PERMS_MASK)
 
 
 def can_use_quest_commands(user: discord.Member, guild: discord.Guild) -> bool:
@@ -64,10 +77,13 @@ def get_required_roles_for_quest(guild: discord.Guild, required_role_ids: List[i
     return roles
 
 
-def user_has_required_roles(user: discord.Member, required_role_ids: List[int]) -> bool:
-    """Check if user has all required roles"""
+def user_has_required_roles(user_role_ids: Iterable[int], required_role_ids: Iterable[int]) -> bool:
+    """Check if a member's role ids include any of the required roles
+
+    Takes plain role ids so callers that already have them (slash command
+    handlers, the quest manager) don't need to fabricate Member objects.
+    """
     if not required_role_ids:
         return True
     
-    user_role_ids = [role.id for role in user.roles]
-    return any(role_id in user_role_ids for role_id in required_role_ids)
\ No newline at end of file
+    return not set(required_role_ids).isdisjoint(user_role_ids)
\ No newline at end of file
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from bot.models import Quest, QuestProgress, QuestRank, QuestCategory, QuestStatus
 from bot.database import Database
 
@@ -40,13 +40,25 @@ class QuestManager:
         """Get quest by ID"""
         return await self.database.get_quest(quest_id)
     
+    async def get_quests_by_ids(self, quest_ids: List[str]) -> Dict[str, Quest]:
+        """Get multiple quests by ID in a single batched fetch"""
+        return await self.database.get_quests_by_ids(quest_ids)
+
+    async def get_quest_and_progress(self, quest_id: str, user_id: int) -> Tuple[Optional[Quest], Optional[QuestProgress]]:
+        """Get a quest and a user's progress on it in one consolidated fetch"""
+        quest = await self.database.get_quest(quest_id)
+        if not quest:
+            return None, None
+        progress = await self.database.get_user_quest_progress(user_id, quest_id)
+        return quest, progress
+
     async def get_guild_quests(self, guild_id: int, status: str = None) -> List[Quest]:
         """Get all quests for a guild, optionally filtered by status"""
         return await self.database.get_guild_quests(guild_id, status)
     
-    async def get_available_quests(self, guild_id: int) -> List[Quest]:
-        """Get all available quests for a guild"""
-        return await self.database.get_guild_quests(guild_id, QuestStatus.AVAILABLE)
+    async def get_available_quests(self, guild_id: int, rank: str = None, category: str = None) -> List[Quest]:
+        """Get available quests for a guild, optionally filtered, pre-sorted by rank"""
+        return await self.database.get_available_quests(guild_id, rank, category)
     
     async def accept_quest(self, quest_id: str, user_id: int, user_role_ids: List[int] = None, 
                           accepted_channel_id: int = None) -> Tuple[Optional[QuestProgress], str]:
@@ -77,7 +89,7 @@ class QuestManager:
         # Check role requirements
         if quest.required_role_ids and user_role_ids:
             from bot.permissions import user_has_required_roles
-            if not user_has_required_roles(type('User', (), {'roles': [type('Role', (), {'id': rid})() for rid in user_role_ids]})(), quest.required_role_ids):
+            if not user_has_required_roles(user_role_ids, quest.required_role_ids):
                 return None, "You don't have the required roles for this quest!"
         
         # Create new progress
@@ -109,13 +121,25 @@ class QuestManager:
         progress.proof_text = proof_text
         progress.proof_image_urls = proof_image_urls or []
         progress.approval_status = "pending"
-        
-        await self.database.save_quest_progress(progress)
+
+        await self.database.patch_quest_progress(
+            user_id, quest_id,
+            status=progress.status,
+            completed_at=progress.completed_at,
+            proof_text=progress.proof_text,
+            proof_image_urls=progress.proof_image_urls,
+            approval_status=progress.approval_status)
         return progress
     
-    async def approve_quest(self, quest_id: str, user_id: int, approved: bool) -> Optional[QuestProgress]:
-        """Approve or reject a completed quest"""
-        progress = await self.database.get_user_quest_progress(user_id, quest_id)
+    async def approve_quest(self, quest_id: str, user_id: int, approved: bool,
+                            progress: Optional[QuestProgress] = None) -> Optional[QuestProgress]:
+        """Approve or reject a completed quest
+
+        Pass an already-loaded progress to skip the re-read; quest_approval
+        has just fetched it for validation.
+        """
+        if progress is None:
+            progress = await self.database.get_user_quest_progress(user_id, quest_id)
         if not progress:
             return None
         
@@ -128,16 +152,19 @@ class QuestManager:
         else:
             progress.status = QuestStatus.REJECTED
             progress.approval_status = "rejected"
-        
-        await self.database.save_quest_progress(progress)
+
+        await self.database.patch_quest_progress(
+            user_id, quest_id,
+            status=progress.status,
+            approval_status=progress.approval_status)
         return progress
     
     async def get_user_quests(self, user_id: int, guild_id: int = None) -> List[QuestProgress]:
         """Get all quests for a user"""
         return await self.database.get_user_quests(user_id, guild_id)
     
-    async def get_pending_approvals(self, creator_id: int, guild_id: int) -> List[tuple]:
-        """Get quests pending approval for a quest creator"""
+    async def get_pending_approvals(self, creator_id: int, guild_id: int) -> List[Tuple[QuestProgress, Quest]]:
+        """Get (progress, quest) pairs pending approval for a quest creator"""
         return await self.database.get_pending_approvals(creator_id, guild_id)
     
     async def delete_quest(self, quest_id: str) -> bool:
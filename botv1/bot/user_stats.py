@@ -34,29 +34,24 @@ class UserStatsManager:
     
     async def update_quest_accepted(self, user_id: int, guild_id: int):
         """Update stats when a quest is accepted"""
-        stats = await self.get_user_stats(user_id, guild_id)
-        stats.quests_accepted += 1
-        stats.last_quest_date = datetime.now()
-        await self.database.save_user_stats(stats)
+        await self.database.increment_user_stats(user_id, guild_id, accepted_delta=1)
     
     async def update_quest_completed(self, user_id: int, guild_id: int):
         """Update stats when a quest is completed/approved"""
-        stats = await self.get_user_stats(user_id, guild_id)
-        stats.quests_completed += 1
-        stats.last_quest_date = datetime.now()
-        await self.database.save_user_stats(stats)
+        await self.database.increment_user_stats(user_id, guild_id, completed_delta=1)
     
     async def update_quest_rejected(self, user_id: int, guild_id: int):
         """Update stats when a quest is rejected"""
-        stats = await self.get_user_stats(user_id, guild_id)
-        stats.quests_rejected += 1
-        stats.last_quest_date = datetime.now()
-        await self.database.save_user_stats(stats)
+        await self.database.increment_user_stats(user_id, guild_id, rejected_delta=1)
     
     async def get_guild_leaderboard(self, guild_id: int, limit: int = 10) -> List[UserStats]:
         """Get guild leaderboard"""
         return await self.database.get_guild_leaderboard(guild_id, limit)
     
+    async def get_guild_leaderboard_with_totals(self, guild_id: int, limit: int = 10):
+        """Get the leaderboard and guild totals from one database pass"""
+        return await self.database.get_guild_leaderboard_with_totals(guild_id, limit)
+    
     async def get_total_guild_stats(self, guild_id: int) -> Dict[str, int]:
         """Get total guild statistics"""
         return await self.database.get_total_guild_stats(guild_id)
\ No newline at end of file
@@ -1,53 +1,117 @@
+import functools
+import itertools
+import re
+from collections import OrderedDict
+
 import discord
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+from bot.models import QuestRank, QuestCategory, QuestStatus
+
+# Color objects are immutable, so build each one once at import instead
+# of per embed
+_RANK_COLORS = {
+    QuestRank.EASY: discord.Color.green(),
+    QuestRank.NORMAL: discord.Color.blue(),
+    QuestRank.MEDIUM: discord.Color.orange(),
+    QuestRank.HARD: discord.Color.red(),
+    QuestRank.IMPOSSIBLE: discord.Color.purple()
+}
+_DEFAULT_RANK_COLOR = discord.Color.light_grey()
+
+_STATUS_COLORS = {
+    'accepted': discord.Color.yellow(),
+    'completed': discord.Color.orange(),
+    'approved': discord.Color.green(),
+    'rejected': discord.Color.red()
+}
+_DEFAULT_STATUS_COLOR = discord.Color.greyple()
+
+_RED = discord.Color.red()
+_GREEN = discord.Color.green()
+_BLUE = discord.Color.blue()
+
+# Titled display forms of the fixed rank/category/status sets, so embed
+# renders skip a Python-level str.title() per value
+_TITLECASE = {value: value.title()
+              for cls in (QuestRank, QuestCategory, QuestStatus)
+              for name, value in vars(cls).items() if not name.startswith('_')}
+
 
 def create_quest_embed(quest: 'Quest', creator: Optional[discord.Member] = None) -> discord.Embed:
     """Create a formatted embed for a quest without emojis"""
-    embed = discord.Embed(
-        title=quest.title,
-        description=quest.description,
-        color=get_rank_color(quest.rank),
-        timestamp=quest.created_at
-    )
-    
+    fields = []
     if quest.requirements:
-        embed.add_field(name="Requirements", value=quest.requirements, inline=False)
-    
+        fields.append({"name": "Requirements", "value": quest.requirements, "inline": False})
     if quest.reward:
-        embed.add_field(name="Reward", value=quest.reward, inline=False)
-    
-    embed.add_field(name="Quest ID", value=f"`{quest.quest_id}`", inline=True)
-    embed.add_field(name="Rank", value=quest.rank.title(), inline=True)
-    embed.add_field(name="Category", value=quest.category.title(), inline=True)
-    embed.add_field(name="Status", value=quest.status.title(), inline=True)
-    
+        fields.append({"name": "Reward", "value": quest.reward, "inline": False})
+    fields.append({"name": "Quest ID", "value": f"`{quest.quest_id}`", "inline": True})
+    fields.append({"name": "Rank", "value": _TITLECASE.get(quest.rank) or quest.rank.title(), "inline": True})
+    fields.append({"name": "Category", "value": _TITLECASE.get(quest.category) or quest.category.title(), "inline": True})
+    fields.append({"name": "Status", "value": _TITLECASE.get(quest.status) or quest.status.title(), "inline": True})
+
+    # One from_dict call replaces the constructor plus six add_field calls
+    payload = {
+        "type": "rich",
+        "title": quest.title,
+        "description": quest.description,
+        "color": get_rank_color(quest.rank).value,
+        "fields": fields,
+    }
+    if quest.created_at:
+        payload["timestamp"] = quest.created_at.isoformat()
     if creator:
-        embed.set_author(name=f"Created by {creator.display_name}", 
-                        icon_url=creator.display_avatar.url if creator.display_avatar else None)
-    
+        payload["author"] = {
+            "name": f"Created by {creator.display_name}",
+            "icon_url": creator.display_avatar.url,
+        }
+    return discord.Embed.from_dict(payload)
+
+
+# Rendered quest embeds keyed by their visible content; bounded LRU
+_EMBED_CACHE: 'OrderedDict[tuple, dict]' = OrderedDict()
+_EMBED_CACHE_SIZE = 256
+
+
+def quest_embed_key(quest: 'Quest', creator: Optional[discord.Member] = None) -> tuple:
+    """Cache key covering everything create_quest_embed renders"""
+    return (quest.quest_id, quest.title, quest.description, quest.requirements,
+            quest.reward, quest.rank, quest.category, quest.status,
+            creator.id if creator else 0)
+
+
+def build_quest_embed_cached(quest: 'Quest', creator: Optional[discord.Member] = None) -> discord.Embed:
+    """create_quest_embed, memoized on the quest's visible content
+
+    Re-renders of an unchanged quest (pagination, refreshes) come back as
+    a cheap Embed.from_dict instead of the field-by-field build. Callers
+    that edit an existing message can also compare quest_embed_key against
+    the key of the embed they last sent and skip the edit entirely.
+    """
+    key = quest_embed_key(quest, creator)
+    cached = _EMBED_CACHE.get(key)
+    if cached is not None:
+        _EMBED_CACHE.move_to_end(key)
+        return discord.Embed.from_dict(cached)
+    embed = create_quest_embed(quest, creator)
+    _EMBED_CACHE[key] = embed.to_dict()
+    if len(_EMBED_CACHE) > _EMBED_CACHE_SIZE:
+        _EMBED_CACHE.popitem(last=False)
     return embed
 
 
 def create_progress_embed(progress: 'QuestProgress', quest: 'Quest', user: Optional[discord.Member] = None) -> discord.Embed:
     """Create a formatted embed for quest progress without emojis"""
-    status_colors = {
-        'accepted': discord.Color.yellow(),
-        'completed': discord.Color.orange(),
-        'approved': discord.Color.green(),
-        'rejected': discord.Color.red()
-    }
-    
     embed = discord.Embed(
         title=f"{quest.title}",
         description=quest.description,
-        color=status_colors.get(progress.status, discord.Color.grey())
+        color=_STATUS_COLORS.get(progress.status, _DEFAULT_STATUS_COLOR)
     )
     
-    embed.add_field(name="Status", value=progress.status.title(), inline=True)
+    embed.add_field(name="Status", value=_TITLECASE.get(progress.status) or progress.status.title(), inline=True)
     embed.add_field(name="Quest ID", value=f"`{quest.quest_id}`", inline=True)
-    embed.add_field(name="Rank", value=quest.rank.title(), inline=True)
+    embed.add_field(name="Rank", value=_TITLECASE.get(quest.rank) or quest.rank.title(), inline=True)
     
     if progress.accepted_at:
         embed.add_field(name="Accepted", value=format_timestamp(progress.accepted_at), inline=True)
@@ -62,60 +126,71 @@ def create_progress_embed(progress: 'QuestProgress', quest: 'Quest', user: Optio
         embed.set_image(url=progress.proof_image_urls[0])
     
     if user:
-        embed.set_footer(text=f"User: {user.display_name}", 
-                        icon_url=user.display_avatar.url if user.display_avatar else None)
+        embed.set_footer(text=f"User: {user.display_name}",
+                        icon_url=user.display_avatar.url)
     
     return embed
 
 
 def get_rank_color(rank: str) -> discord.Color:
     """Get color based on quest rank"""
-    from bot.models import QuestRank
-    colors = {
-        QuestRank.EASY: discord.Color.green(),
-        QuestRank.NORMAL: discord.Color.blue(),
-        QuestRank.MEDIUM: discord.Color.orange(),
-        QuestRank.HARD: discord.Color.red(),
-        QuestRank.IMPOSSIBLE: discord.Color.purple()
-    }
-    return colors.get(rank, discord.Color.light_grey())
+    return _RANK_COLORS.get(rank, _DEFAULT_RANK_COLOR)
 
 
+@functools.singledispatch
 def format_timestamp(timestamp) -> str:
     """Format timestamp for display"""
+    return "N/A"
+
+
+@format_timestamp.register
+def _(timestamp: datetime) -> str:
+    return _format_iso(timestamp.isoformat())
+
+
+@format_timestamp.register
+def _(timestamp: str) -> str:
+    return _format_iso(timestamp) if timestamp else "N/A"
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_iso(timestamp: str) -> str:
+    """Parse and format one ISO timestamp, memoized across renders"""
+    # The database writes datetime.isoformat(), so the display string is
+    # just the first 16 characters with the 'T' swapped for a space; a
+    # shape check plus two slices beats the generic ISO parser + strftime
+    if (len(timestamp) >= 16 and timestamp[4] == '-' and timestamp[7] == '-'
+            and timestamp[10] in 'T ' and timestamp[13] == ':'):
+        return f"{timestamp[:10]} {timestamp[11:16]}"
     try:
-        if isinstance(timestamp, datetime):
-            return timestamp.strftime("%Y-%m-%d %H:%M")
-        elif isinstance(timestamp, str) and timestamp:
-            dt = datetime.fromisoformat(timestamp)
-            return dt.strftime("%Y-%m-%d %H:%M")
-        else:
-            return "N/A"
-    except:
-        return str(timestamp) if timestamp else "N/A"
+        dt = datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError):
+        return timestamp
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
 
 
 def truncate_text(text: str, max_length: int = 1000) -> str:
     """Truncate text to fit within Discord embed limits"""
     if len(text) <= max_length:
         return text
-    return text[:max_length-3] + "..."
+    return f"{text[:max_length-3]}..."
+
+
+# (min length, max length, rejection message) per validate_quest_data field
+_QUEST_FIELD_LIMITS = (
+    (1, 100, "Quest title must be between 1 and 100 characters"),
+    (1, 2000, "Quest description must be between 1 and 2000 characters"),
+    (0, 1000, "Requirements must be less than 1000 characters"),
+    (0, 1000, "Reward must be less than 1000 characters"),
+)
 
 
 def validate_quest_data(title: str, description: str, requirements: str = "", reward: str = "") -> Optional[str]:
     """Validate quest creation data"""
-    if not title or len(title) > 100:
-        return "Quest title must be between 1 and 100 characters"
-    
-    if not description or len(description) > 2000:
-        return "Quest description must be between 1 and 2000 characters"
-    
-    if len(requirements) > 1000:
-        return "Requirements must be less than 1000 characters"
-    
-    if len(reward) > 1000:
-        return "Reward must be less than 1000 characters"
-    
+    values = (title, description, requirements, reward)
+    for value, (min_len, max_len, message) in zip(values, _QUEST_FIELD_LIMITS):
+        if not min_len <= len(value) <= max_len:
+            return message
     return None
 
 
@@ -123,30 +198,30 @@ def format_quest_list(quests: List['Quest'], max_quests: int = 10) -> str:
     """Format a list of quests for display"""
     if not quests:
         return "No quests available"
-    
-    quest_list = []
-    for quest in quests[:max_quests]:
-        quest_list.append(f"**{quest.title}** (ID: `{quest.quest_id}`) - {quest.rank.title()}")
-    
+
+    quest_list = [
+        f"**{quest.title}** (ID: `{quest.quest_id}`) - {_TITLECASE.get(quest.rank) or quest.rank.title()}"
+        for quest in itertools.islice(quests, max_quests)]
+
     if len(quests) > max_quests:
         quest_list.append(f"... and {len(quests) - max_quests} more")
-    
+
     return "\n".join(quest_list)
 
 
-def is_valid_quest_id(quest_id: str) -> bool:
-    """Check if a quest ID has a valid format"""
-    return len(quest_id) == 8 and quest_id.replace('-', '').isalnum()
+# Quest IDs are the first 8 characters of a uuid4 string
+_QUEST_ID_RE = re.compile(r'[A-Za-z0-9-]{8}')
 
 
-def get_user_mention(user_id: int) -> str:
-    """Get a user mention string"""
-    return f"<@{user_id}>"
+def is_valid_quest_id(quest_id: str) -> bool:
+    """Check if a quest ID has a valid format"""
+    return _QUEST_ID_RE.fullmatch(quest_id) is not None
 
 
-def get_role_mention(role_id: int) -> str:
-    """Get a role mention string"""
-    return f"<@&{role_id}>"
+# Bound str.format methods: the whole call runs in the C formatter with
+# no Python frame
+get_user_mention = "<@{}>".format
+get_role_mention = "<@&{}>".format
 
 
 def create_error_embed(title: str, description: str) -> discord.Embed:
@@ -154,7 +229,7 @@ def create_error_embed(title: str, description: str) -> discord.Embed:
     return discord.Embed(
         title=title,
         description=description,
-        color=discord.Color.red()
+        color=_RED
     )
 
 
@@ -163,7 +238,7 @@ def create_success_embed(title: str, description: str) -> discord.Embed:
     return discord.Embed(
         title=title,
         description=description,
-        color=discord.Color.green()
+        color=_GREEN
     )
 
 
@@ -172,5 +247,5 @@ def create_info_embed(title: str, description: str) -> discord.Embed:
     return discord.Embed(
         title=title,
         description=description,
-        color=discord.Color.blue()
+        color=_BLUE
     )
\ No newline at end of file
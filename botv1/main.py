@@ -9,28 +9,42 @@ from bot.quest_manager import QuestManager
 from bot.config import ChannelConfig
 from bot.user_stats import UserStatsManager
 
-from flask import Flask
-from threading import Thread
+from aiohttp import web
 import logging
-
-logging.basicConfig(level=logging.INFO)
-logging.info("Bot is starting...")
-
-# --- Flask ping server setup ---
-app = Flask(__name__)
-
-@app.route('/')
-def home():
-    return "Bot and pinger are alive!"
-
-def run_flask():
+import logging.handlers
+import queue
+
+# Log records go to an in-memory queue; the listener thread does the
+# actual stream writes so log I/O never blocks the event loop
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO,
+                    handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+_log_listener.start()
+
+log = logging.getLogger(__name__)
+log.info("Bot is starting...")
+
+# --- keep-alive ping server setup ---
+
+async def ping(request):
+    return web.Response(text="Bot and pinger are alive!")
+
+async def start_ping_server():
+    """Serve the health-check route on the bot's own event loop
+
+    No extra thread: the old Flask dev server woke a second thread (and
+    the GIL) on every poll while the event loop was serving gateway
+    heartbeats.
+    """
+    app = web.Application()
+    app.router.add_get('/', ping)
+    runner = web.AppRunner(app)
+    await runner.setup()
     port = int(os.environ.get("PORT", 5000))
-    app.run(host="0.0.0.0", port=port, debug=False)
-
-def start_flask():
-    t = Thread(target=run_flask)
-    t.daemon = True
-    t.start()
+    await web.TCPSite(runner, "0.0.0.0", port).start()
 
 # --- Discord bot setup ---
 
@@ -74,7 +88,8 @@ async def on_command_error(ctx, error):
     elif isinstance(error, commands.CommandNotFound):
         pass  # Ignore command not found errors
     else:
-        print(f'Error in command {ctx.command}: {error}')
+        # %s formatting is deferred until the record is actually emitted
+        log.warning('Error in command %s: %s', ctx.command, error)
         await ctx.send("❌ An error occurred while processing your command.")
 
 # JSON database with auto-git commits
@@ -84,20 +99,28 @@ async def main():
     global database, quest_manager, channel_config, user_stats_manager
 
     try:
-        # Setup git repository for auto-commits
-        import subprocess
-        subprocess.run(['python', 'setup_git.py'], check=False)
-        
-        # Initialize JSON database
-        database = JSONDatabase()
-        await database.initialize()
+        # Start the keep-alive ping server on this loop
+        await start_ping_server()
 
-        # Initialize other components
+        # Initialize JSON database and other components (constructors
+        # don't await; only the initialize calls below touch disk)
+        database = JSONDatabase()
         quest_manager = QuestManager(database)
         channel_config = ChannelConfig(database)
-        await channel_config.initialize()
         user_stats_manager = UserStatsManager(database)
 
+        # Git setup shells out while the database reads its snapshot;
+        # the two are independent, so overlap them. AUTOCOMMIT_GIT=0
+        # skips git on deployments that don't use the git-backed data dir
+        startup = [database.initialize()]
+        if os.environ.get('AUTOCOMMIT_GIT', '1') != '0':
+            from setup_git import setup_git
+            startup.append(asyncio.to_thread(setup_git))
+        await asyncio.gather(*startup)
+
+        # Reads channel configs from the database, so it runs after
+        await channel_config.initialize()
+
         # Add the quest commands cog
         await bot.add_cog(QuestCommands(bot, quest_manager, channel_config, user_stats_manager))
 
@@ -117,9 +140,6 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        # Start Flask server
-        start_flask()
-
         # Run the async main function and bot
         asyncio.run(main())
 
@@ -6,21 +6,20 @@ import os
 def setup_git():
     """Initialize git repository and set up for auto-commits"""
     try:
-        # Check if git is already initialized
-        result = subprocess.run(['git', 'status'], capture_output=True, text=True)
+        # Check if git is already initialized; rev-parse answers from the
+        # .git lookup alone where `git status` walks the working tree
+        result = subprocess.run(['git', 'rev-parse', '--git-dir'],
+                                capture_output=True, text=True)
         if result.returncode != 0:
             print("Initializing git repository...")
             subprocess.run(['git', 'init'], check=True)
             
-            # Set up basic git config if not set
-            try:
-                subprocess.run(['git', 'config', 'user.name'], check=True, capture_output=True)
-            except subprocess.CalledProcessError:
+            # Read the config once instead of probing each key separately
+            config = subprocess.run(['git', 'config', '--list'],
+                                    capture_output=True, text=True).stdout
+            if 'user.name=' not in config:
                 subprocess.run(['git', 'config', 'user.name', 'Quest Bot'], check=True)
-                
-            try:
-                subprocess.run(['git', 'config', 'user.email'], check=True, capture_output=True)
-            except subprocess.CalledProcessError:
+            if 'user.email=' not in config:
                 subprocess.run(['git', 'config', 'user.email', 'bot@example.com'], check=True)
             
             print("Git repository initialized!")
@@ -30,10 +29,15 @@ def setup_git():
         # Create data directory if it doesn't exist
         os.makedirs('data', exist_ok=True)
         
-        # Add .gitignore if it doesn't exist
-        if not os.path.exists('.gitignore'):
+        # Add .gitignore if it doesn't exist; O_EXCL makes the common
+        # already-there path one failing syscall instead of stat + open
+        try:
+            fd = os.open('.gitignore', os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            pass
+        else:
             print("Creating .gitignore...")
-            with open('.gitignore', 'w') as f:
+            with os.fdopen(fd, 'w') as f:
                 f.write("__pycache__/\n*.pyc\n!data/\n")
         
         print("Git setup complete!")